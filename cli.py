@@ -3,23 +3,42 @@ Interactive CLI for Spotify Controller
 Allows users to search and play playlists by name with real-time control
 """
 
+import logging
 import sys
 import time
 import threading
-from typing import Optional
-import yaml
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
 
-from spotify_module import (
-    PlatformDetector, 
-    DeviceManager, 
-    PlaylistManager, 
-    PlaybackController
-)
 from logger import get_logger
 
 
+_HELP_TEXT = "\n".join([
+    "",
+    "Available commands:",
+    "  [p]ause     - Pause playback",
+    "  [r]esume    - Resume playback",
+    "  [s]top      - Stop playback",
+    "  [v] <num>   - Set volume (0-100)",
+    "  [n]ext      - Skip to next track",
+    "  [b]ack      - Go to previous track",
+    "  [i]nfo      - Show current track info",
+    "  [st]atus    - Show playback status",
+    "  [h]elp      - Show this help",
+    "  [q]uit      - Quit application",
+    "  <playlist>  - Search and play new playlist",
+    "",
+])
+
+
+# Defaults filled into the loaded configuration
+_CONFIG_DEFAULTS = {
+    'device_name': 'SpotifyBot',
+    'default_volume': 50,
+}
+_DEFAULT_REDIRECT_URI = 'http://localhost:8888/callback'
+
+
 class SpotifyControllerCLI:
     """Interactive command-line interface for Spotify automation"""
     
@@ -35,42 +54,109 @@ class SpotifyControllerCLI:
         # CLI state
         self.running = False
         self.current_playlist = None
+        self._shutdown = threading.Event()
+        
+        # Command word -> handler, built once rather than matched per command
+        self._commands = self._build_commands()
         
     def load_config(self, config_path: str = "config/config.yaml") -> bool:
         """Load configuration from YAML file"""
+        # Imported here to keep CLI startup fast on low-powered devices
+        import yaml
+        try:
+            # libyaml-backed loader, when PyYAML was built with it
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+        
         try:
             with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
-            self.logger.info(f"Configuration loaded from {config_path}")
+                self.config = yaml.load(f, Loader=SafeLoader)
+            self.logger.info("Configuration loaded from %s", config_path)
             return True
         except FileNotFoundError:
-            self.logger.error(f"Configuration file not found: {config_path}")
+            self.logger.error("Configuration file not found: %s", config_path)
             self.logger.info("Please create a config.yaml file with your Spotify credentials")
             return False
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            self.logger.error("Error loading configuration: %s", e)
+            return False
+    
+    def _validate_config(self) -> bool:
+        """
+        Check required settings and fill in defaults
+        
+        Returns:
+            True if the configuration can be used
+        """
+        if not isinstance(self.config, dict):
+            self.logger.error("Configuration is empty or not a mapping")
+            return False
+        
+        spotify_config = self.config.get('spotify')
+        if not isinstance(spotify_config, dict):
+            self.logger.error("Configuration is missing the 'spotify' section")
+            return False
+        
+        missing = [key for key in ('client_id', 'client_secret') if not spotify_config.get(key)]
+        if missing:
+            self.logger.error("Missing Spotify credentials in configuration: %s", ", ".join(missing))
             return False
+        
+        spotify_config.setdefault('redirect_uri', _DEFAULT_REDIRECT_URI)
+        redirect = urlparse(spotify_config['redirect_uri'])
+        if redirect.scheme not in ('http', 'https') or not redirect.netloc:
+            self.logger.error("Invalid redirect_uri: %s", spotify_config['redirect_uri'])
+            return False
+        
+        for key, value in _CONFIG_DEFAULTS.items():
+            self.config.setdefault(key, value)
+        
+        return True
     
     def initialize_components(self) -> bool:
         """Initialize all controller components"""
+        # Catch configuration mistakes before any slow imports or network calls
+        if not self._validate_config():
+            return False
+        
+        # spotipy and the controller modules are only loaded once they are needed
+        import spotipy
+        from spotipy.oauth2 import SpotifyOAuth
+        from spotify_module import (
+            PlatformDetector, 
+            DeviceManager, 
+            PlaylistManager, 
+            PlaybackController,
+            create_session,
+            REQUEST_TIMEOUT
+        )
+        
         try:
             # Initialize platform detection
             self.platform = PlatformDetector()
-            self.logger.info(f"Platform detected: {self.platform.get_platform_summary()}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Platform detected: %s", self.platform.get_platform_summary())
             
             # Initialize Spotify client
             spotify_config = self.config['spotify']
+            session = create_session()
             self.spotify_client = spotipy.Spotify(auth_manager=SpotifyOAuth(
                 client_id=spotify_config['client_id'],
                 client_secret=spotify_config['client_secret'],
-                redirect_uri=spotify_config.get('redirect_uri', 'http://localhost:8888/callback'),
+                redirect_uri=spotify_config['redirect_uri'],
                 scope="user-read-playback-state user-modify-playback-state playlist-read-private playlist-read-collaborative",
-                cache_path=".spotify_cache"
-            ))
+                cache_path=".spotify_cache",
+                # Headless devices print the authorization URL instead
+                open_browser=self.platform.has_gui(),
+                requests_session=session,
+                requests_timeout=REQUEST_TIMEOUT
+            ), requests_session=session, requests_timeout=REQUEST_TIMEOUT)
             
-            # Test authentication
-            user_info = self.spotify_client.current_user()
-            self.logger.info(f"Authenticated as: {user_info['id']}")
+            # Make sure a token is available, prompting for authorization if
+            # there is none. A valid cached token is used without any request.
+            self.spotify_client.auth_manager.get_access_token(as_dict=False)
+            self.logger.info("Authenticated with Spotify")
             
             # Initialize device manager
             self.device_manager = DeviceManager(self.platform, self.config)
@@ -84,21 +170,22 @@ class SpotifyControllerCLI:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error initializing components: {e}")
+            self.logger.error("Error initializing components: %s", e)
             return False
     
     def setup_device(self) -> bool:
         """Setup and ensure spotifyd device is ready"""
         try:
-            device_name = self.config.get('device_name', 'SpotifyBot')
+            device_name = self.config['device_name']
             
             # Ensure spotifyd is ready
             if not self.device_manager.ensure_spotifyd_ready(device_name, self.config['spotify']):
                 self.logger.error("Failed to setup spotifyd device")
                 return False
             
-            # Wait a moment for device to appear in Spotify
-            time.sleep(3)
+            # Wait for the device to register with Spotify
+            if not self._wait_for_device(device_name):
+                self.logger.warning("Device '%s' did not appear within the timeout", device_name)
             
             # Set device for playback controller
             if not self.playback_controller.set_device(device_name=device_name):
@@ -108,9 +195,59 @@ class SpotifyControllerCLI:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error setting up device: {e}")
+            self.logger.error("Error setting up device: %s", e)
             return False
     
+    def _start_token_refresher(self, interval: float = 30.0):
+        """
+        Refresh the OAuth token in the background shortly before it expires
+        
+        Without this, the first API call after expiry blocks on a round trip
+        to the accounts service. The thread stops when the CLI shuts down.
+        """
+        auth_manager = self.spotify_client.auth_manager
+        
+        def refresh_loop():
+            while not self._shutdown.wait(interval):
+                try:
+                    token = auth_manager.cache_handler.get_cached_token()
+                    # is_token_expired() reports tokens within 60 s of expiry
+                    if token and auth_manager.is_token_expired(token):
+                        auth_manager.refresh_access_token(token['refresh_token'])
+                        self.logger.debug("OAuth token refreshed in background")
+                except Exception as e:
+                    self.logger.warning("Error refreshing OAuth token: %s", e)
+        
+        thread = threading.Thread(target=refresh_loop, name="token-refresh")
+        thread.daemon = True
+        thread.start()
+    
+    def _wait_for_device(self, device_name: str, timeout: float = 3.0) -> bool:
+        """
+        Poll Spotify until a device with the given name is listed
+        
+        Polling starts at 100 ms and backs off exponentially, so a quickly
+        registering device is picked up without waiting for the full timeout.
+        
+        Returns:
+            True if the device appeared before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        name = device_name.lower()
+        
+        while True:
+            devices = self.playback_controller.get_available_devices(refresh=True)
+            if any(name in device['name'].lower() for device in devices):
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            
+            time.sleep(min(delay, remaining))
+            delay *= 2
+    
     def search_and_select_playlist(self, query: str) -> Optional[dict]:
         """Search for playlists and let user select one"""
         try:
@@ -148,140 +285,154 @@ class SpotifyControllerCLI:
                     print("Please enter a valid number or 'q' to quit")
                     
         except Exception as e:
-            self.logger.error(f"Error searching playlists: {e}")
+            self.logger.error("Error searching playlists: %s", e)
             return None
     
     def start_playlist_playback(self, playlist: dict) -> bool:
         """Start playing the selected playlist"""
         try:
-            print(f"\nLoading tracks from '{playlist['name']}'...")
-            track_uris = self.playlist_manager.get_playlist_tracks(playlist['id'])
-            
-            if not track_uris:
+            if not playlist['track_count']:
                 print("No tracks found in playlist")
                 return False
             
-            print(f"Found {len(track_uris)} tracks")
-            
-            # Start playback
+            # Play the playlist itself rather than a list of its tracks, so
+            # playback starts at once and Spotify handles shuffle and repeat
             print("Starting playback...")
-            success = self.playback_controller.start_playback(track_uris)
+            success = self.playback_controller.start_playlist(
+                playlist['uri'], track_count=playlist['track_count']
+            )
             if success:
-                volume = self.config.get('default_volume', 50)
+                volume = self.config['default_volume']
                 self.playback_controller.set_volume(volume)
                 print(f"Volume set to {volume}%")
-            
-            if success:
+                
                 self.current_playlist = playlist
-                print(f"✓ Now playing: {playlist['name']}")
+                print(f"✓ Now playing: {playlist['name']} ({playlist['track_count']} tracks)")
                 return True
             else:
                 print("✗ Failed to start playback")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error starting playlist playback: {e}")
+            self.logger.error("Error starting playlist playback: %s", e)
             return False
     
     def show_help(self):
         """Display available commands"""
-        print("\nAvailable commands:")
-        print("  [p]ause     - Pause playback")
-        print("  [r]esume    - Resume playback")
-        print("  [s]top      - Stop playback")
-        print("  [v] <num>   - Set volume (0-100)")
-        print("  [n]ext      - Skip to next track")
-        print("  [b]ack      - Go to previous track")
-        print("  [i]nfo      - Show current track info")
-        print("  [st]atus    - Show playback status")
-        print("  [h]elp      - Show this help")
-        print("  [q]uit      - Quit application")
-        print("  <playlist>  - Search and play new playlist")
+        sys.stdout.write(_HELP_TEXT)
     
     def handle_command(self, command: str) -> bool:
         """Handle user commands during playback"""
         command = command.strip().lower()
         
-        if command in ['p', 'pause']:
-            if self.playback_controller.pause_playback():
-                print("⏸ Playback paused")
-            else:
-                print("✗ Failed to pause")
-                
-        elif command in ['r', 'resume']:
-            if self.playback_controller.resume_playback():
-                print("▶ Playback resumed")
-            else:
-                print("✗ Failed to resume")
-                
-        elif command in ['s', 'stop']:
-            if self.playback_controller.stop_playback():
-                print("⏹ Playback stopped")
-                self.current_playlist = None
-            else:
-                print("✗ Failed to stop")
-                
-        elif command.startswith('v '):
-            try:
-                volume = int(command.split()[1])
-                if self.playback_controller.set_volume(volume):
-                    print(f"🔊 Volume set to {volume}%")
-                else:
-                    print("✗ Failed to set volume")
-            except (ValueError, IndexError):
-                print("Usage: v <number> (0-100)")
-                
-        elif command in ['n', 'next']:
-            if self.playback_controller.next_track():
-                print("⏭ Skipped to next track")
-            else:
-                print("✗ Failed to skip track")
-                
-        elif command in ['b', 'back']:
-            if self.playback_controller.previous_track():
-                print("⏮ Went to previous track")
-            else:
-                print("✗ Failed to go back")
-                
-        elif command in ['i', 'info']:
-            state = self.playback_controller.get_playback_state()
-            if state:
-                track = state['track']
-                progress_min = state['progress_ms'] // 60000
-                progress_sec = (state['progress_ms'] % 60000) // 1000
-                duration_min = track['duration_ms'] // 60000
-                duration_sec = (track['duration_ms'] % 60000) // 1000
-                
-                print(f"🎵 {track['name']} by {track['artist']}")
-                print(f"⏱ {progress_min}:{progress_sec:02d} / {duration_min}:{duration_sec:02d}")
-                print(f"🔊 Volume: {state['device']['volume_percent']}%")
-            else:
-                print("No playback information available")
-                
-        elif command in ['st', 'status']:
-            status = self.playback_controller.get_status()
-            print(f"\nPlayback Status:")
-            print(f"  Playing: {'Yes' if status['is_playing'] else 'No'}")
-            print(f"  Volume: {status['current_volume']}%")
-            print(f"  Volume Ramp: {'Active' if status['volume_ramp_active'] else 'Inactive'}")
-            print(f"  Playlist: {status['current_playlist'] or 'None'}")
-            print(f"  Tracks: {status['track_count']}")
-            
-        elif command in ['h', 'help']:
-            self.show_help()
-            
-        elif command in ['q', 'quit']:
-            return False
-            
-        else:
+        handler = self._commands.get(command)
+        if handler:
+            # Handlers only return a value (False) to end the session
+            return handler() is not False
+        
+        if command.startswith('v '):
+            self._cmd_volume(command[2:])
+        elif command:
             # Treat as playlist search
-            if command:
-                playlist = self.search_and_select_playlist(command)
-                if playlist:
-                    self.start_playlist_playback(playlist)
+            self._cmd_search(command)
             
         return True
     
+    def _build_commands(self) -> Dict[str, Callable[[], Optional[bool]]]:
+        """Map every command word and its shortcut to its handler"""
+        commands = {}
+        for names, handler in (
+            (('p', 'pause'), self._cmd_pause),
+            (('r', 'resume'), self._cmd_resume),
+            (('s', 'stop'), self._cmd_stop),
+            (('n', 'next'), self._cmd_next),
+            (('b', 'back'), self._cmd_back),
+            (('i', 'info'), self._cmd_info),
+            (('st', 'status'), self._cmd_status),
+            (('h', 'help'), self.show_help),
+            (('q', 'quit'), self._cmd_quit),
+        ):
+            for name in names:
+                commands[name] = handler
+        return commands
+    
+    def _cmd_pause(self):
+        if self.playback_controller.pause_playback():
+            print("⏸ Playback paused")
+        else:
+            print("✗ Failed to pause")
+    
+    def _cmd_resume(self):
+        if self.playback_controller.resume_playback():
+            print("▶ Playback resumed")
+        else:
+            print("✗ Failed to resume")
+    
+    def _cmd_stop(self):
+        if self.playback_controller.stop_playback():
+            print("⏹ Playback stopped")
+            self.current_playlist = None
+        else:
+            print("✗ Failed to stop")
+    
+    def _cmd_volume(self, argument: str):
+        try:
+            volume = int(argument.split()[0])
+            if self.playback_controller.set_volume(volume):
+                print(f"🔊 Volume set to {volume}%")
+            else:
+                print("✗ Failed to set volume")
+        except (ValueError, IndexError):
+            print("Usage: v <number> (0-100)")
+    
+    def _cmd_next(self):
+        if self.playback_controller.next_track():
+            print("⏭ Skipped to next track")
+        else:
+            print("✗ Failed to skip track")
+    
+    def _cmd_back(self):
+        if self.playback_controller.previous_track():
+            print("⏮ Went to previous track")
+        else:
+            print("✗ Failed to go back")
+    
+    def _cmd_info(self):
+        state = self.playback_controller.get_playback_state()
+        if state:
+            track = state['track']
+            progress_min, progress_sec = divmod(state['progress_ms'] // 1000, 60)
+            duration_min, duration_sec = divmod(track['duration_ms'] // 1000, 60)
+            
+            sys.stdout.write(
+                f"🎵 {track['name']} by {track['artist']}\n"
+                f"⏱ {progress_min}:{progress_sec:02d} / {duration_min}:{duration_sec:02d}\n"
+                f"🔊 Volume: {state['device']['volume_percent']}%\n"
+            )
+        else:
+            print("No playback information available")
+    
+    def _cmd_status(self):
+        status = self.playback_controller.get_status()
+        sys.stdout.write("\n".join([
+            "",
+            "Playback Status:",
+            f"  Playing: {'Yes' if status['is_playing'] else 'No'}",
+            f"  Volume: {status['current_volume']}%",
+            f"  Volume Ramp: {'Active' if status['volume_ramp_active'] else 'Inactive'}",
+            f"  Playlist: {status['current_playlist'] or 'None'}",
+            f"  Tracks: {status['track_count']}",
+            "",
+        ]))
+    
+    def _cmd_quit(self) -> bool:
+        return False
+    
+    def _cmd_search(self, query: str):
+        playlist = self.search_and_select_playlist(query)
+        if playlist:
+            self.start_playlist_playback(playlist)
+    
     def run_interactive_mode(self):
         """Run the interactive command loop"""
         print("\n" + "="*60)
@@ -289,6 +440,7 @@ class SpotifyControllerCLI:
         print("="*60)
         
         self.show_help()
+        self._enable_line_editing()
         
         print(f"\nCurrent device: {self.playback_controller.device_id}")
         print("Ready! Enter a playlist name to search and play, or use commands above.")
@@ -313,12 +465,30 @@ class SpotifyControllerCLI:
                     
         finally:
             # Cleanup
+            self._shutdown.set()
             if self.playback_controller:
-                self.playback_controller.stop_playback()
+                self.playback_controller.close()
             if self.device_manager:
                 self.device_manager.stop_spotifyd()
             print("Goodbye!")
     
+    def _enable_line_editing(self):
+        """Enable input history and tab completion of command words"""
+        try:
+            import readline
+        except ImportError:
+            # Not available on every platform, input() still works without it
+            return
+        
+        words = sorted(self._commands)
+        
+        def complete(text, state):
+            matches = [word for word in words if word.startswith(text)]
+            return matches[state] if state < len(matches) else None
+        
+        readline.set_completer(complete)
+        readline.parse_and_bind("tab: complete")
+    
     def run(self, config_path: str = "config.yaml"):
         """Main entry point"""
         print("🎵 Spotify Controller Starting...")
@@ -331,6 +501,12 @@ class SpotifyControllerCLI:
         if not self.initialize_components():
             return False
         
+        # Ctrl-C and SIGTERM end the command loop so cleanup below runs
+        self.playback_controller.install_signal_handlers()
+        
+        # Keep the OAuth token fresh so commands never wait on a refresh
+        self._start_token_refresher()
+        
         # Setup device
         if not self.setup_device():
             return False
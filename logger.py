@@ -2,55 +2,91 @@
 Logger utility for Spotify Controller
 """
 
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Shared by every handler. QueueHandler.prepare() still merges a record's
+# arguments into its message on the calling thread; this formatter only adds
+# the timestamp, name and level on the listener thread before the I/O
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Log files rotate at 1 MiB, keeping three old files per logger
+_MAX_LOG_BYTES = 1_048_576
+_LOG_BACKUP_COUNT = 3
+
+# Loggers only enqueue records; a single listener thread does the file and
+# console I/O so logging never blocks the calling thread
+_LOG_QUEUE = queue.SimpleQueue()
+_LISTENER = None
+_LOGGERS = {}
+
+
+def _get_listener() -> QueueListener:
+    """Start the shared queue listener on first use"""
+    global _LISTENER
+
+    if _LISTENER is None:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_FORMATTER)
+
+        _LISTENER = QueueListener(_LOG_QUEUE, console_handler, respect_handler_level=True)
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
+
+    return _LISTENER
 
 
 def get_logger(name: str, log_level: str = "INFO") -> logging.Logger:
     """
     Create and configure a logger for the given name.
-    
+
     Args:
         name: Name of the logger (typically the device name)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    
+
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    
     # Avoid adding multiple handlers if logger already exists
-    if logger.handlers:
-        return logger
-    
+    if name in _LOGGERS:
+        return _LOGGERS[name]
+
+    logger = logging.getLogger(name)
+
     # Set log level
     level = getattr(logging, log_level.upper(), logging.INFO)
     logger.setLevel(level)
-    
+
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
-    
-    # Create file handler
+
+    # Create file handler, the file is only opened once a record is written
     log_filename = f"logs/{name.replace(' ', '_').lower()}.log"
-    file_handler = logging.FileHandler(log_filename)
-    file_handler.setLevel(level)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+    file_handler = RotatingFileHandler(
+        log_filename,
+        maxBytes=_MAX_LOG_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        delay=True
     )
-    
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    file_handler.setFormatter(_FORMATTER)
+
+    # The listener is shared, so each file only accepts its own logger's records
+    file_handler.addFilter(logging.Filter(name))
+
+    listener = _get_listener()
+    listener.handlers = listener.handlers + (file_handler,)
+
+    # Add handlers to logger, records are fully handled here so they are
+    # not passed on to the root logger's handlers as well
+    logger.addHandler(QueueHandler(_LOG_QUEUE))
+    logger.propagate = False
+
+    _LOGGERS[name] = logger
     return logger
@@ -14,6 +14,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    py_modules=["cli", "logger", "main"],
     install_requires=requirements,
     python_requires=">=3.7",
     entry_points={
@@ -46,5 +47,5 @@ setup(
         "cross-platform", "cli", "spotifyd", "audio", "controller"
     ],
     include_package_data=True,
-    zip_safe=False,
+    zip_safe=True,
 )
@@ -9,10 +9,15 @@ from .platform_detector import PlatformDetector
 from .device_manager import DeviceManager
 from .playlist_manager import PlaylistManager
 from .playback_controller import PlaybackController
+from .cache import PlaylistCache
+from .session import create_session, REQUEST_TIMEOUT
 
 __all__ = [
     'PlatformDetector',
     'DeviceManager', 
     'PlaylistManager',
-    'PlaybackController'
+    'PlaybackController',
+    'PlaylistCache',
+    'create_session',
+    'REQUEST_TIMEOUT'
 ]
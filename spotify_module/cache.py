@@ -0,0 +1,226 @@
+"""
+Cache Module
+Persistent on-disk caching of playlist track lists, playlist details and
+search results, and short-lived in-memory caching of idempotent API calls
+"""
+
+import functools
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from logger import get_logger
+
+
+DEFAULT_CACHE_PATH = ".spotify_playlists.sqlite"
+
+# How long search results stay valid, in seconds
+SEARCH_TTL = 600
+
+# How long playlist details and the user's playlist list stay valid, in seconds
+ENTRY_TTL = 3600
+
+
+def ttl_cache(seconds: float):
+    """
+    Memoize a method's return value per instance for a number of seconds
+
+    Entries are keyed on the method name and positional arguments and can be
+    dropped early with invalidate_ttl_cache(). Entry access is guarded by a
+    per-instance lock, the wrapped call itself runs outside it.
+
+    Args:
+        seconds: How long a cached value stays valid
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            entries = self.__dict__.setdefault('_ttl_cache', {})
+            lock = self.__dict__.setdefault('_ttl_cache_lock', threading.Lock())
+            key = (func.__name__, args)
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+
+            value = func(self, *args)
+            with lock:
+                entries[key] = (time.monotonic() + seconds, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def invalidate_ttl_cache(obj, *names: str):
+    """
+    Drop ttl_cache entries held by an object
+
+    Args:
+        obj: Instance whose methods are decorated with ttl_cache
+        names: Method names to invalidate, all entries when omitted
+    """
+    entries = obj.__dict__.get('_ttl_cache')
+    if not entries:
+        return
+
+    with obj.__dict__['_ttl_cache_lock']:
+        if not names:
+            entries.clear()
+            return
+
+        for key in [key for key in entries if key[0] in names]:
+            del entries[key]
+
+
+class PlaylistCache:
+    """SQLite-backed cache for playlist tracks, playlist details and search results"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self.logger = get_logger("playlist_cache")
+        self._lock = threading.Lock()
+
+        # The connection is shared between the CLI thread and worker threads,
+        # access is serialised through self._lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS playlists ("
+                "playlist_id TEXT PRIMARY KEY, snapshot_id TEXT, "
+                "uris_json BLOB, fetched_at INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "query TEXT PRIMARY KEY, results_json BLOB, fetched_at INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value_json BLOB, fetched_at INTEGER)"
+            )
+
+        self.logger.debug(f"PlaylistCache opened at {path}")
+
+    def get_tracks(self, playlist_id: str, snapshot_id: str) -> Optional[List[str]]:
+        """
+        Get cached track URIs for a playlist
+
+        Args:
+            playlist_id: Spotify playlist ID
+            snapshot_id: Current snapshot ID of the playlist
+
+        Returns:
+            List of track URIs, or None on a miss or stale snapshot
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT snapshot_id, uris_json FROM playlists WHERE playlist_id = ?",
+                    (playlist_id,)
+                ).fetchone()
+
+            if row is None or row[0] != snapshot_id:
+                return None
+            return json.loads(row[1])
+
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Error reading cached tracks: {e}")
+            return None
+
+    def put_tracks(self, playlist_id: str, snapshot_id: str, uris: List[str]):
+        """Store track URIs for a playlist snapshot"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO playlists VALUES (?, ?, ?, ?)",
+                    (playlist_id, snapshot_id, json.dumps(uris), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error caching tracks: {e}")
+
+    def get_search(self, user_id: str, query: str, limit: int) -> Optional[List[Dict]]:
+        """Get a user's cached search results if they are younger than SEARCH_TTL"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT results_json, fetched_at FROM searches WHERE query = ?",
+                    (self._search_key(user_id, query, limit),)
+                ).fetchone()
+
+            if row is None or time.time() - row[1] > SEARCH_TTL:
+                return None
+            return json.loads(row[0])
+
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Error reading cached search: {e}")
+            return None
+
+    def put_search(self, user_id: str, query: str, limit: int, results: List[Dict]):
+        """Store a user's search results"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                    (self._search_key(user_id, query, limit), json.dumps(results), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error caching search: {e}")
+
+    def get_entry(self, key: str, ttl: float = ENTRY_TTL) -> Optional[Any]:
+        """
+        Get a cached value if it is younger than ttl seconds
+
+        Args:
+            key: Cache key, e.g. 'info:<playlist_id>'
+            ttl: Maximum age of the value in seconds
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value_json, fetched_at FROM entries WHERE key = ?",
+                    (key,)
+                ).fetchone()
+
+            if row is None or time.time() - row[1] > ttl:
+                return None
+            return json.loads(row[0])
+
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Error reading cache entry {key}: {e}")
+            return None
+
+    def put_entry(self, key: str, value: Any):
+        """Store a JSON-serialisable value"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    (key, json.dumps(value), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error caching entry {key}: {e}")
+
+    def invalidate_playlist(self, playlist_id: str):
+        """Drop the cached tracks and details of a playlist"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM playlists WHERE playlist_id = ?", (playlist_id,))
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (f"info:{playlist_id}",))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error invalidating playlist {playlist_id}: {e}")
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _search_key(user_id: str, query: str, limit: int) -> str:
+        # Results include the user's own playlists, so one user's search
+        # must never be served to another sharing the same cache file
+        return f"{user_id}|{query.lower()}|{limit}"
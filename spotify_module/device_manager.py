@@ -3,6 +3,8 @@ Device Manager Module
 Handles spotifyd installation, configuration, and lifecycle management
 """
 
+import hashlib
+import json
 import os
 import subprocess
 import time
@@ -10,16 +12,96 @@ import requests
 import tarfile
 import zipfile
 import shutil
+import string
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import tempfile
-import signal
 import psutil
 
 from .platform_detector import PlatformDetector
 from logger import get_logger
 
 
+# Block size used when streaming release downloads to disk
+DOWNLOAD_BLOCK_SIZE = 256 * 1024
+
+# Permissions given to the installed spotifyd binary
+BINARY_MODE = 0o755
+
+# Release metadata is reused for a day before GitHub is asked again
+RELEASE_CACHE_FILE = 'spotifyd_release.json'
+RELEASE_CACHE_TTL = 24 * 60 * 60
+
+# spotifyd.conf contents, string values are TOML-escaped before substitution
+SPOTIFYD_CONFIG_TEMPLATE = string.Template("""[global]
+username = "$username"
+password = "$password"
+client_id = "$client_id"
+client_secret = "$client_secret"
+
+device_name = "$device_name"
+device_type = "computer"
+mixer = "softvol"
+volume_controller = "softvol"
+backend = "$backend"
+bitrate = $bitrate
+cache_path = "$cache_path"
+
+volume_normalisation = $volume_normalisation
+normalisation_pregain = $normalisation_pregain
+
+no_audio_cache = false
+use_mpris = false
+""")
+
+SPOTIFYD_PI_CONFIG = """
+# Raspberry Pi specific settings
+initial_volume = "50"
+max_cache_size = 1000000000
+"""
+
+# Key under which resolved download URLs are stored in the cached release
+RESOLVED_ASSETS_KEY = '_resolved_assets'
+
+
+# Characters with a short escape in TOML basic strings, other control
+# characters are written as \uXXXX
+_TOML_ESCAPES = {
+    '\\': '\\\\', '"': '\\"', '\b': '\\b', '\t': '\\t',
+    '\n': '\\n', '\f': '\\f', '\r': '\\r'
+}
+
+
+def _toml_escape(value) -> str:
+    """Escape a value for use inside a double-quoted TOML string"""
+    return ''.join(
+        _TOML_ESCAPES.get(char)
+        or (f'\\u{ord(char):04x}' if char < ' ' or char == '\x7f' else char)
+        for char in str(value)
+    )
+
+
+class _HashingReader:
+    """File-like wrapper that computes a SHA-256 digest of everything read"""
+    
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+    
+    def drain(self):
+        """Read the rest of the stream so the digest covers all of it"""
+        while self.read(DOWNLOAD_BLOCK_SIZE):
+            pass
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
 class DeviceManager:
     """Manages spotifyd installation and device lifecycle"""
     
@@ -30,18 +112,19 @@ class DeviceManager:
         self.config = config or {}
         self.logger = get_logger("device_manager")
         self.spotifyd_path = self._get_spotifyd_path()
-        self.config_dir = Path(self.platform.get_config_recommendations()['config_path'])
-        self.cache_dir = Path(self.platform.get_config_recommendations()['cache_path'])
+        platform_config = self.platform.get_config_recommendations()
+        self.config_dir = Path(platform_config['config_path'])
+        self.cache_dir = Path(platform_config['cache_path'])
+        self.pid_file = self.cache_dir / 'spotifyd.pid'
         self._spotifyd_process = None
+        self._release_etag = None
         
         self.logger.info(f"DeviceManager initialized for platform: {self.platform.get_platform_summary()}")
         
     def _get_spotifyd_path(self) -> Path:
         """Get the path where spotifyd should be installed"""
-        if self.platform.is_macos():
-            return Path.home() / '.local' / 'bin' / 'spotifyd'
-        else:
-            return Path.home() / '.local' / 'bin' / 'spotifyd'
+        # The same location is used on every platform
+        return Path.home() / '.local' / 'bin' / 'spotifyd'
     
     def is_spotifyd_installed(self) -> bool:
         """Check if spotifyd is installed and executable"""
@@ -49,37 +132,60 @@ class DeviceManager:
         self.logger.debug(f"spotifyd installed check: {installed} at {self.spotifyd_path}")
         return installed
     
-    def is_spotifyd_running(self) -> bool:
-        """Check if spotifyd process is currently running"""
+    def _find_spotifyd_process(self) -> Optional[psutil.Process]:
+        """Find a running spotifyd, trying the PID file before the process table"""
+        proc = self._get_pidfile_process()
+        if proc:
+            self.logger.debug(f"Found running spotifyd process from PID file: PID {proc.pid}")
+            return proc
+        
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                if proc.info['name'] == 'spotifyd' or (
-                    proc.info['cmdline'] and 
-                    any('spotifyd' in arg for arg in proc.info['cmdline'])
-                ):
+            # Only names are read for every process, command lines are read
+            # just for the few whose name partially matches
+            for proc in psutil.process_iter(['pid', 'name']):
+                name = proc.info['name'] or ''
+                if name == 'spotifyd':
                     self.logger.debug(f"Found running spotifyd process: PID {proc.info['pid']}")
-                    return True
+                    return proc
+                if 'spotifyd' in name:
+                    try:
+                        cmdline = proc.cmdline()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                    if cmdline and os.path.basename(cmdline[0]) == 'spotifyd':
+                        self.logger.debug(f"Found running spotifyd process: PID {proc.info['pid']}")
+                        return proc
             self.logger.debug("No running spotifyd process found")
-            return False
+            return None
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             self.logger.warning(f"Error checking spotifyd process: {e}")
-            return False
+            return None
+    
+    def _get_pidfile_process(self) -> Optional[psutil.Process]:
+        """Get the spotifyd process recorded in our PID file, if it is still alive"""
+        try:
+            pid = int(self.pid_file.read_text().strip())
+            proc = psutil.Process(pid)
+            if proc.name() == 'spotifyd':
+                return proc
+        except (OSError, ValueError, psutil.Error):
+            pass
+        return None
+    
+    def is_spotifyd_running(self) -> bool:
+        """Check if spotifyd process is currently running"""
+        # A process we started is checked through its handle, the process
+        # table is only searched for one started elsewhere
+        if self._spotifyd_process is not None:
+            return self._spotifyd_process.poll() is None
+        return self._find_spotifyd_process() is not None
     
     def get_spotifyd_pid(self) -> Optional[int]:
         """Get the PID of running spotifyd process"""
-        try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                if proc.info['name'] == 'spotifyd' or (
-                    proc.info['cmdline'] and 
-                    any('spotifyd' in arg for arg in proc.info['cmdline'])
-                ):
-                    pid = proc.info['pid']
-                    self.logger.debug(f"Found spotifyd PID: {pid}")
-                    return pid
-            return None
-        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            self.logger.warning(f"Error getting spotifyd PID: {e}")
-            return None
+        if self._spotifyd_process is not None:
+            return self._spotifyd_process.pid if self._spotifyd_process.poll() is None else None
+        proc = self._find_spotifyd_process()
+        return proc.pid if proc else None
     
     def install_spotifyd(self, force_reinstall: bool = False) -> bool:
         """Download and install spotifyd for the current platform"""
@@ -94,17 +200,16 @@ class DeviceManager:
             self.spotifyd_path.parent.mkdir(parents=True, exist_ok=True)
             self.logger.debug(f"Created directory: {self.spotifyd_path.parent}")
             
-            # Get download URL
-            download_url = self._get_download_url()
-            if not download_url:
+            # Get download URL and the digest published for it
+            download_info = self._get_download_info()
+            if not download_info:
                 self.logger.error("Could not find appropriate spotifyd binary for this platform")
                 return False
+            download_url, expected_sha256 = download_info
             
             # Download and extract
             self.logger.info(f"Downloading from: {download_url}")
-            if self._download_and_extract(download_url):
-                # Make executable
-                os.chmod(self.spotifyd_path, 0o755)
+            if self._download_and_extract(download_url, expected_sha256):
                 self.logger.info(f"spotifyd installed successfully at: {self.spotifyd_path}")
                 return True
             else:
@@ -115,22 +220,40 @@ class DeviceManager:
             self.logger.error(f"Error installing spotifyd: {e}")
             return False
     
-    def _get_download_url(self) -> Optional[str]:
-        """Get the download URL for the appropriate spotifyd binary"""
+    def _get_download_info(self) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get the download URL for the appropriate spotifyd binary
+        
+        Returns:
+            Tuple of download URL and expected SHA-256 hex digest, the digest
+            is None when the release does not publish one
+        """
         try:
-            self.logger.debug(f"Fetching release info from: {self.SPOTIFYD_RELEASES_URL}")
-            response = requests.get(self.SPOTIFYD_RELEASES_URL)
-            response.raise_for_status()
-            release_data = response.json()
+            release_data = self._get_release_data()
             
             binary_name = self.platform.get_spotifyd_binary_name()
-            self.logger.debug(f"Looking for binary matching: {binary_name}")
             
-            for asset in release_data['assets']:
-                if binary_name in asset['name']:
-                    url = asset['browser_download_url']
-                    self.logger.debug(f"Found matching asset: {asset['name']} -> {url}")
-                    return url
+            # Assets resolved earlier are stored with the cached release, so
+            # they are dropped together with it when a new release comes out
+            resolved = release_data.setdefault(RESOLVED_ASSETS_KEY, {})
+            if binary_name in resolved:
+                url, sha256 = resolved[binary_name]
+                self.logger.debug(f"Using cached asset for {binary_name}: {url}")
+                return url, sha256
+            
+            self.logger.debug(f"Looking for binary matching: {binary_name}")
+            asset = self._find_asset(release_data['assets'], binary_name)
+            if asset:
+                url = asset['browser_download_url']
+                self.logger.debug(f"Found matching asset: {asset['name']} -> {url}")
+                sha256 = self._get_asset_sha256(asset, release_data['assets'])
+                
+                # Only remember complete results, a checksum that failed to
+                # download is looked up again next time
+                if sha256:
+                    resolved[binary_name] = [url, sha256]
+                    self._save_release_cache(release_data, keep_mtime=True)
+                return url, sha256
             
             self.logger.error(f"Could not find binary matching: {binary_name}")
             self.logger.debug(f"Available assets: {[asset['name'] for asset in release_data['assets']]}")
@@ -140,56 +263,206 @@ class DeviceManager:
             self.logger.error(f"Error fetching release info: {e}")
             return None
     
-    def _download_and_extract(self, url: str) -> bool:
-        """Download and extract spotifyd binary"""
+    @staticmethod
+    def _find_asset(assets: List[Dict], binary_name: str) -> Optional[Dict]:
+        """Find the release asset for a binary, trying its exact name first"""
+        assets_by_name = {asset['name']: asset for asset in assets}
+        
+        asset = assets_by_name.get(binary_name + '.tar.gz')
+        if asset:
+            return asset
+        
+        # Release names sometimes carry a variant suffix, fall back to the
+        # first asset containing the binary name that is not a checksum
+        for asset in assets:
+            if binary_name in asset['name'] and not asset['name'].endswith('.sha256'):
+                return asset
+        return None
+    
+    def _get_asset_sha256(self, asset: Dict, assets: List[Dict]) -> Optional[str]:
+        """
+        Get the published SHA-256 digest of a release asset
+        
+        GitHub reports a digest for each asset, older releases fall back to a
+        '<name>.sha256' file published alongside the asset.
+        """
+        digest = asset.get('digest') or ''
+        if digest.startswith('sha256:'):
+            return digest[len('sha256:'):].lower()
+        
+        checksum_name = asset['name'] + '.sha256'
+        for candidate in assets:
+            if candidate['name'] == checksum_name:
+                try:
+                    response = requests.get(candidate['browser_download_url'])
+                    response.raise_for_status()
+                    return response.text.split()[0].lower()
+                except (requests.RequestException, IndexError) as e:
+                    self.logger.warning(f"Could not fetch checksum {checksum_name}: {e}")
+                    return None
+        
+        return None
+    
+    def _verify_sha256(self, actual: str, expected: Optional[str]) -> bool:
+        """Compare a download's digest with the published one"""
+        if not expected:
+            self.logger.warning("No SHA-256 digest published for this release, skipping verification")
+            return True
+        
+        if actual != expected:
+            self.logger.error(f"SHA-256 mismatch for spotifyd download: expected {expected}, got {actual}")
+            return False
+        
+        self.logger.debug(f"SHA-256 verified: {actual}")
+        return True
+    
+    def _get_release_data(self) -> Dict:
+        """
+        Get the latest spotifyd release metadata
+        
+        The response is cached on disk for RELEASE_CACHE_TTL seconds. After
+        that it is revalidated with its ETag, and a 304 reply reuses the cached
+        copy without counting against GitHub's rate limit.
+        """
+        cache_file = self.cache_dir / RELEASE_CACHE_FILE
+        
+        cached = None
+        self._release_etag = None
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if time.time() - cache_file.stat().st_mtime < RELEASE_CACHE_TTL:
+                self.logger.debug(f"Using cached release info from: {cache_file}")
+                self._release_etag = cached.get('etag')
+                return cached['release']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        
+        self.logger.debug(f"Fetching release info from: {self.SPOTIFYD_RELEASES_URL}")
+        response = requests.get(self.SPOTIFYD_RELEASES_URL, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            self.logger.debug("Release info not modified, reusing cached copy")
+            cache_file.touch()
+            self._release_etag = cached.get('etag')
+            return cached['release']
+        
+        response.raise_for_status()
+        release_data = response.json()
+        
+        self._release_etag = response.headers.get('ETag')
+        self._save_release_cache(release_data)
+        return release_data
+    
+    def _save_release_cache(self, release_data: Dict, keep_mtime: bool = False):
+        """
+        Write release metadata to the on-disk cache
+        
+        Args:
+            release_data: Release metadata to cache
+            keep_mtime: Keep the file's modification time so the TTL still
+                counts from when GitHub was last asked
+        """
+        cache_file = self.cache_dir / RELEASE_CACHE_FILE
+        
+        try:
+            stat = cache_file.stat() if keep_mtime and cache_file.exists() else None
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({'etag': self._release_etag, 'release': release_data}, f)
+            if stat:
+                os.utime(cache_file, (stat.st_atime, stat.st_mtime))
+        except OSError as e:
+            self.logger.warning(f"Could not cache release info: {e}")
+    
+    def _download_and_extract(self, url: str, expected_sha256: Optional[str] = None) -> bool:
+        """
+        Download and extract spotifyd binary
+        
+        The download is hashed as it is read, and the binary is only moved
+        into place once the digest matches expected_sha256.
+        """
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # The streamed response is closed on every exit path, which
+            # releases its connection even when the archive is not fully read
+            with tempfile.TemporaryDirectory() as temp_dir, \
+                    requests.get(url, stream=True) as response:
                 temp_path = Path(temp_dir)
+                binary_path = None
                 
                 # Download file
-                self.logger.debug(f"Downloading to temporary directory: {temp_path}")
-                response = requests.get(url, stream=True)
                 response.raise_for_status()
+                response.raw.decode_content = True
+                reader = _HashingReader(response.raw)
                 
                 filename = url.split('/')[-1]
-                download_path = temp_path / filename
-                
-                with open(download_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
                 
-                self.logger.debug(f"Downloaded {filename} ({download_path.stat().st_size} bytes)")
-                
-                # Extract based on file type
                 if filename.endswith('.tar.gz'):
-                    self.logger.debug("Extracting tar.gz archive")
-                    with tarfile.open(download_path, 'r:gz') as tar:
-                        # Find the spotifyd binary in the archive
-                        for member in tar.getmembers():
+                    # tar.gz reads forward only, so it is extracted straight
+                    # from the download stream without writing the archive
+                    self.logger.debug("Extracting tar.gz archive from download stream")
+                    with tarfile.open(fileobj=reader, mode='r|gz') as tar:
+                        # Find the spotifyd binary in the archive, members are
+                        # read lazily so parsing stops at the first match
+                        for member in tar:
                             if member.name.endswith('spotifyd') and member.isfile():
                                 tar.extract(member, temp_path)
-                                extracted_path = temp_path / member.name
-                                shutil.move(str(extracted_path), str(self.spotifyd_path))
-                                self.logger.debug(f"Extracted and moved binary from {member.name}")
-                                return True
-                elif filename.endswith('.zip'):
-                    self.logger.debug("Extracting zip archive")
-                    with zipfile.ZipFile(download_path, 'r') as zip_file:
-                        for member in zip_file.namelist():
-                            if member.endswith('spotifyd'):
-                                zip_file.extract(member, temp_path)
-                                extracted_path = temp_path / member
-                                shutil.move(str(extracted_path), str(self.spotifyd_path))
-                                self.logger.debug(f"Extracted and moved binary from {member}")
-                                return True
+                                binary_path = temp_path / member.name
+                                # The archive's mode is kept, which is
+                                # normally executable already
+                                if not os.access(binary_path, os.X_OK):
+                                    os.chmod(binary_path, BINARY_MODE)
+                                self.logger.debug(f"Extracted binary from {member.name}")
+                                break
+                    
+                    # Hash whatever the archive reader left unread
+                    reader.drain()
                 else:
-                    # Assume it's a direct binary
-                    self.logger.debug("Treating as direct binary")
-                    shutil.move(str(download_path), str(self.spotifyd_path))
-                    return True
+                    # zip needs random access, so it is downloaded first
+                    self.logger.debug(f"Downloading to temporary directory: {temp_path}")
+                    download_path = temp_path / filename
+                    
+                    # Copy straight from the raw stream in large blocks instead of
+                    # iterating over small chunks in Python
+                    with open(download_path, 'wb') as f:
+                        shutil.copyfileobj(reader, f, DOWNLOAD_BLOCK_SIZE)
+                        if not filename.endswith('.zip'):
+                            os.fchmod(f.fileno(), BINARY_MODE)
+                    
+                    self.logger.debug(f"Downloaded {filename} ({download_path.stat().st_size} bytes)")
+                    
+                    if filename.endswith('.zip'):
+                        self.logger.debug("Extracting zip archive")
+                        with zipfile.ZipFile(download_path, 'r') as zip_file:
+                            for member in zip_file.namelist():
+                                if member.endswith('spotifyd'):
+                                    # zip does not keep Unix modes, so the
+                                    # binary is written and made executable here
+                                    binary_path = temp_path / 'spotifyd'
+                                    with zip_file.open(member) as src, open(binary_path, 'wb') as dst:
+                                        shutil.copyfileobj(src, dst, DOWNLOAD_BLOCK_SIZE)
+                                        os.fchmod(dst.fileno(), BINARY_MODE)
+                                    self.logger.debug(f"Extracted binary from {member}")
+                                    break
+                    else:
+                        # Assume it's a direct binary
+                        self.logger.debug("Treating as direct binary")
+                        binary_path = download_path
                 
-                self.logger.error("Could not find spotifyd binary in downloaded archive")
-                return False
+                if binary_path is None:
+                    self.logger.error("Could not find spotifyd binary in downloaded archive")
+                    return False
+                
+                if not self._verify_sha256(reader.hexdigest(), expected_sha256):
+                    return False
+                
+                shutil.move(str(binary_path), str(self.spotifyd_path))
+                self.logger.debug(f"Moved binary to {self.spotifyd_path}")
+                return True
                 
         except Exception as e:
             self.logger.error(f"Error downloading/extracting: {e}")
@@ -206,37 +479,36 @@ class DeviceManager:
             config_file = self.config_dir / 'spotifyd.conf'
             platform_config = self.platform.get_config_recommendations()
             
-            config_content = f"""[global]
-username = "{spotify_config.get('username', '')}"
-password = "{spotify_config.get('password', '')}"
-client_id = "{spotify_config['client_id']}"
-client_secret = "{spotify_config['client_secret']}"
-
-device_name = "{device_name}"
-device_type = "computer"
-mixer = "softvol"
-volume_controller = "softvol"
-backend = "{platform_config['audio_backend']}"
-bitrate = {platform_config['bitrate']}
-cache_path = "{self.cache_dir}"
-
-volume_normalisation = {str(platform_config['volume_normalisation']).lower()}
-normalisation_pregain = {platform_config['normalisation_pregain']}
-
-no_audio_cache = false
-use_mpris = false
-"""
+            config_content = SPOTIFYD_CONFIG_TEMPLATE.substitute(
+                username=_toml_escape(spotify_config.get('username', '')),
+                password=_toml_escape(spotify_config.get('password', '')),
+                client_id=_toml_escape(spotify_config['client_id']),
+                client_secret=_toml_escape(spotify_config['client_secret']),
+                device_name=_toml_escape(device_name),
+                backend=_toml_escape(platform_config['audio_backend']),
+                bitrate=platform_config['bitrate'],
+                cache_path=_toml_escape(self.cache_dir),
+                volume_normalisation=str(platform_config['volume_normalisation']).lower(),
+                normalisation_pregain=platform_config['normalisation_pregain']
+            )
             
             # Add platform-specific settings
             if self.platform.is_raspberry_pi():
-                config_content += """
-# Raspberry Pi specific settings
-initial_volume = "50"
-max_cache_size = 1000000000
-"""
+                config_content += SPOTIFYD_PI_CONFIG
             
-            with open(config_file, 'w') as f:
+            # Write to a temporary file and swap it in, so spotifyd never reads
+            # a partly written config. It holds credentials, so only the owner
+            # may read it. A leftover temporary file is removed first, as the
+            # mode only applies to a newly created file.
+            temp_file = config_file.with_suffix('.tmp')
+            try:
+                temp_file.unlink()
+            except FileNotFoundError:
+                pass
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(fd, 'w') as f:
                 f.write(config_content)
+            os.replace(temp_file, config_file)
             
             self.logger.info(f"Created spotifyd config at: {config_file}")
             return True
@@ -259,9 +531,11 @@ max_cache_size = 1000000000
         device_name = device_name or f"SpotifyBot-{self.platform._get_device_name_suffix()}"
         
         try:
+            # spotifyd always runs in the foreground so the Popen handle refers
+            # to the daemon itself rather than a parent that exits after forking
             cmd = [
                 str(self.spotifyd_path),
-                '--no-daemon' if not background else '--daemon',
+                '--no-daemon',
                 '--device-name', device_name
             ]
             
@@ -274,17 +548,21 @@ max_cache_size = 1000000000
             self.logger.info(f"Starting spotifyd with command: {' '.join(cmd)}")
             
             if background:
-                # Start as background process
-                process = subprocess.Popen(
+                # Start as background process in its own session, detached from
+                # the terminal, keeping the handle for later lifecycle calls
+                self._spotifyd_process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                     start_new_session=True
                 )
-                # Give it time to start
-                time.sleep(3)
                 
-                if self.is_spotifyd_running():
+                # Record the PID so a later run can find this instance without
+                # scanning the process table
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self.pid_file.write_text(str(self._spotifyd_process.pid))
+                
+                if self._wait_for_spotifyd_ready():
                     self.logger.info(f"spotifyd started successfully as device: {device_name}")
                     return True
                 else:
@@ -293,8 +571,7 @@ max_cache_size = 1000000000
             else:
                 # Start in foreground (for debugging)
                 self._spotifyd_process = subprocess.Popen(cmd)
-                time.sleep(2)
-                success = self._spotifyd_process.poll() is None
+                success = self._wait_for_spotifyd_ready()
                 if success:
                     self.logger.info(f"spotifyd started in foreground as device: {device_name}")
                 else:
@@ -305,20 +582,71 @@ max_cache_size = 1000000000
             self.logger.error(f"Error starting spotifyd: {e}")
             return False
     
+    def _wait_for_spotifyd_ready(self, timeout: float = 3.0) -> bool:
+        """
+        Wait for the spotifyd process we started to come up
+        
+        spotifyd counts as ready once it has opened a network socket. Polling
+        starts at 50 ms and backs off exponentially, and stops straight away if
+        the process exits.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if spotifyd is ready, or still running when the timeout expires
+        """
+        process = self._spotifyd_process
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        
+        try:
+            proc = psutil.Process(process.pid)
+            # Renamed to net_connections in psutil 6.0
+            connections = getattr(proc, 'net_connections', None) or proc.connections
+        except psutil.Error:
+            return process.poll() is None
+        
+        while True:
+            if process.poll() is not None:
+                self.logger.debug(f"spotifyd exited early with code {process.returncode}")
+                return False
+            
+            try:
+                if connections(kind='inet'):
+                    return True
+            except psutil.AccessDenied:
+                # Sockets cannot be inspected here, fall back to liveness only
+                pass
+            except psutil.NoSuchProcess:
+                return False
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return process.poll() is None
+            
+            time.sleep(min(delay, remaining))
+            delay *= 2
+    
     def stop_spotifyd(self) -> bool:
         """Stop spotifyd daemon"""
         try:
-            pid = self.get_spotifyd_pid()
-            if pid:
-                self.logger.info(f"Stopping spotifyd process (PID: {pid})")
-                os.kill(pid, signal.SIGTERM)
-                time.sleep(2)
+            if self._spotifyd_process is not None:
+                return self._stop_own_process()
+            
+            proc = self._find_spotifyd_process()
+            if proc:
+                self.logger.info(f"Stopping spotifyd process (PID: {proc.pid})")
+                proc.terminate()
                 
-                # Force kill if still running
-                if self.is_spotifyd_running():
+                # Returns as soon as the process exits, force kill if it
+                # ignores SIGTERM
+                try:
+                    proc.wait(timeout=2)
+                except psutil.TimeoutExpired:
                     self.logger.warning("spotifyd still running, force killing...")
-                    os.kill(pid, signal.SIGKILL)
-                    time.sleep(1)
+                    proc.kill()
+                    proc.wait(timeout=1)
                 
                 self.logger.info("spotifyd stopped")
                 return True
@@ -330,6 +658,30 @@ max_cache_size = 1000000000
             self.logger.error(f"Error stopping spotifyd: {e}")
             return False
     
+    def _stop_own_process(self) -> bool:
+        """Stop the spotifyd process started by this manager"""
+        process = self._spotifyd_process
+        self._spotifyd_process = None
+        
+        if process.poll() is not None:
+            self.logger.info("spotifyd is not running")
+        else:
+            self.logger.info(f"Stopping spotifyd process (PID: {process.pid})")
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.logger.warning("spotifyd still running, force killing...")
+                process.kill()
+                process.wait()
+            self.logger.info("spotifyd stopped")
+        
+        try:
+            self.pid_file.unlink()
+        except OSError:
+            pass
+        return True
+    
     def restart_spotifyd(self, device_name: str = None) -> bool:
         """Restart spotifyd daemon"""
         self.logger.info("Restarting spotifyd...")
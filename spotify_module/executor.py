@@ -0,0 +1,35 @@
+"""
+Executor Module
+Provides the bounded worker pool shared by short-lived API fan-out
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Upper bound on worker threads across every manager and controller
+MAX_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool, creating it on first use
+
+    Only short tasks belong here, such as a search or a page fetch. The
+    pool's threads are not daemons, so the interpreter waits for running
+    tasks at exit, and a long task would also hold one of the few slots.
+    Long-running loops use daemon threads instead. Work submitted here must
+    not wait on other work in the same pool, or a full pool could deadlock.
+
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='spotify')
+        return _executor
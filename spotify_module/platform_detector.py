@@ -11,39 +11,47 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 
+# The running OS and architecture, read once at import
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+
+# Read limits for the files checked when detecting a Raspberry Pi
+MODEL_READ_SIZE = 256
+CPUINFO_READ_SIZE = 4096
+
+
 class PlatformDetector:
     """Detects platform-specific information for cross-platform compatibility"""
     
+    # Detection results are shared by every instance, the platform does not
+    # change while the process is running
+    _shared_info: Optional[Dict[str, any]] = None
+    _shared_recommendations: Optional[Dict[str, any]] = None
+    
     def __init__(self):
-        self._system = platform.system().lower()
-        self._machine = platform.machine().lower()
-        self._platform_info = {
-            'system': self._system,
-            'machine': self._machine,
-            'is_raspberry_pi': self._is_raspberry_pi_setup(),
-            'is_macos': self._system == 'darwin',
-            'is_linux': self._system == 'linux',
-            'is_arm': 'arm' in self._machine or 'aarch64' in self._machine
-        }
-        self._platform_info["audio_system"] = self._detect_audio_system()
-        self._platform_info["has_gui"] = self._has_gui_environment()
-        self._platform_info["spotifyd_binary_name"] = self._get_spotifyd_binary_name()
+        self._system = _SYSTEM
+        self._machine = _MACHINE
+        if PlatformDetector._shared_info is None:
+            PlatformDetector._shared_info = self._detect_platform_info()
+        self._platform_info = PlatformDetector._shared_info
 
     def _detect_platform_info(self) -> Dict[str, any]:
         """Detect comprehensive platform information"""
-        info = {
+        self._platform_info = {
             'system': self._system,
             'machine': self._machine,
             'is_raspberry_pi': self._is_raspberry_pi_setup(),
             'is_macos': self._system == 'darwin',
             'is_linux': self._system == 'linux',
-            'is_arm': 'arm' in self._machine or 'aarch64' in self._machine,
-            'audio_system': self._detect_audio_system(),
-            'has_gui': self._has_gui_environment(),
-            'spotifyd_binary_name': self._get_spotifyd_binary_name()
+            'is_arm': 'arm' in self._machine or 'aarch64' in self._machine
         }
+        
+        # These checks go through the public accessors for the fields above
+        self._platform_info['audio_system'] = self._detect_audio_system()
+        self._platform_info['has_gui'] = self._has_gui_environment()
+        self._platform_info['spotifyd_binary_name'] = self._get_spotifyd_binary_name()
 
-        return info
+        return self._platform_info
     
     def _is_raspberry_pi_setup(self) -> bool:
         """Check if running on Raspberry Pi"""
@@ -56,22 +64,24 @@ class PlatformDetector:
             '/sys/firmware/devicetree/base/model'
         ]
         
+        # The model is a short NUL-terminated string, opening it directly
+        # saves a separate existence check
         for indicator in pi_indicators:
-            if os.path.exists(indicator):
-                try:
-                    with open(indicator, 'r') as f:
-                        content = f.read().lower()
-                        if 'raspberry pi' in content:
-                            return True
-                except:
-                    pass
+            try:
+                with open(indicator, 'rb') as f:
+                    content = f.read(MODEL_READ_SIZE).lower()
+                    if b'raspberry pi' in content:
+                        return True
+            except OSError:
+                pass
         
-        # Check /proc/cpuinfo as fallback
+        # Check /proc/cpuinfo as fallback, the Pi hardware lines follow only a
+        # few short per-core blocks so the start of the file is enough
         try:
-            with open('/proc/cpuinfo', 'r') as f:
-                content = f.read().lower()
-                return 'raspberry pi' in content or 'bcm' in content
-        except:
+            with open('/proc/cpuinfo', 'rb') as f:
+                content = f.read(CPUINFO_READ_SIZE).lower()
+                return b'raspberry pi' in content or b'bcm' in content
+        except OSError:
             return False
     
     def _detect_audio_system(self) -> str:
@@ -79,14 +89,11 @@ class PlatformDetector:
         if self.is_macos():
             return 'coreaudio'
         elif self.is_linux():
-            # Check for PulseAudio
-            if shutil.which('pulseaudio') or os.path.exists('/usr/bin/pulseaudio'):
+            # Check for PulseAudio at its usual location before searching PATH
+            if os.path.exists('/usr/bin/pulseaudio') or shutil.which('pulseaudio'):
                 return 'pulseaudio'
-            # Check for ALSA
-            elif os.path.exists('/proc/asound') or shutil.which('aplay'):
-                return 'alsa'
-            else:
-                return 'alsa'  # Default for Linux
+            # ALSA is used otherwise, whether or not its tools are installed
+            return 'alsa'
         else:
             return 'unknown'
     
@@ -152,6 +159,12 @@ class PlatformDetector:
     
     def get_config_recommendations(self) -> Dict[str, any]:
         """Get recommended configuration for this platform"""
+        if PlatformDetector._shared_recommendations is None:
+            PlatformDetector._shared_recommendations = self._build_config_recommendations()
+        return PlatformDetector._shared_recommendations.copy()
+    
+    def _build_config_recommendations(self) -> Dict[str, any]:
+        """Build the recommended configuration for this platform"""
         config = {
             'device_name_suffix': self._get_device_name_suffix(),
             'audio_backend': self.get_audio_system(),
@@ -6,51 +6,247 @@ Handles Spotify playback control, volume management, and background operations
 import time
 import threading
 import signal
-import sys
-from typing import Dict, List, Optional, Callable
-import spotipy
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable
 from logger import get_logger
 
+from .cache import ttl_cache, invalidate_ttl_cache
+from .session import ensure_pooled_session
+
+if TYPE_CHECKING:
+    # Only needed for annotations, the client is passed in by the caller
+    import spotipy
+
+
+# How long playback-state responses are reused, in seconds
+STATE_CACHE_TTL = 3
+
+# Minimum time between volume updates sent during a ramp, in seconds
+MIN_VOLUME_API_INTERVAL = 0.5
+
+# Default interval between background playback-state polls, in seconds
+STATE_POLL_INTERVAL = 5.0
+
+# How long the device list is reused, in seconds. It is also dropped after
+# every state-changing call and when a device call fails.
+DEVICES_CACHE_TTL = 30
+
+# Volume requests arriving within this window are sent as one update, in seconds
+VOLUME_DEBOUNCE_INTERVAL = 0.1
+
 
 class PlaybackController:
     """Controls Spotify playback with background operation support"""
     
-    def __init__(self, spotify_client: spotipy.Spotify, device_id: str = None):
+    def __init__(self, spotify_client: 'spotipy.Spotify', device_id: str = None):
         self.sp = spotify_client
-        self.device_id = device_id
         self.logger = get_logger("playback_controller")
+        ensure_pooled_session(self.sp)
         
-        # Background operation state
+        # Status shared with callers, published as an immutable snapshot that
+        # is swapped whole so readers never need a lock. Writers serialise on
+        # _state_lock so concurrent updates are not lost.
+        self._state_lock = threading.Lock()
+        self._state = MappingProxyType({
+            'is_playing': False,
+            'current_volume': 50,
+            'volume_ramp_active': False,
+            'current_playlist': None,
+            'device_id': device_id,
+            'track_count': 0
+        })
+        
+        # Background operation state. Long-running workers use daemon
+        # threads rather than the shared pool, so they neither hold pool
+        # slots nor keep the interpreter alive at exit.
         self._background_thread = None
         self._stop_background = threading.Event()
-        self._is_playing = False
-        self._current_volume = 50
-        self._volume_ramp_active = False
         
-        # Playback state
-        self._current_playlist = None
+        # Optional background polling of the playback state. While it runs,
+        # readers are served the last polled state without an API call.
+        self._poll_thread = None
+        self._poll_interval = STATE_POLL_INTERVAL
+        self._poll_wake = threading.Event()
+        self._polling = False
+        self._playback_snapshot = None
+        
+        # Tracks started or queued for the current playlist
         self._current_tracks = []
         
+        # Latest level from request_volume() still to be sent, and whether a
+        # daemon sender thread is already running to send it
+        self._volume_lock = threading.Lock()
+        self._pending_volume = None
+        self._volume_sender_active = False
+        
+        # close() runs once, however many shutdown paths call it
+        self._close_lock = threading.Lock()
+        self._closed = False
+        
         self.logger.info("PlaybackController initialized")
+    
+    def _update_state(self, **changes):
+        """Publish a new status snapshot with the given fields changed"""
+        with self._state_lock:
+            self._state = MappingProxyType({**self._state, **changes})
+    
+    @property
+    def device_id(self) -> Optional[str]:
+        """ID of the device that playback commands are sent to"""
+        return self._state['device_id']
+    
+    @device_id.setter
+    def device_id(self, device_id: Optional[str]):
+        self._update_state(device_id=device_id)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        Stop background work and pause playback
         
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-    
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        self.logger.info(f"Received signal {signum}, stopping playback...")
-        self.stop_playback()
-        sys.exit(0)
-    
-    def get_available_devices(self) -> List[Dict]:
-        """Get list of available Spotify devices"""
-        try:
-            devices = self.sp.devices()
-            device_list = []
+        Only the first call has any effect, and playback is only paused if
+        it is playing, so shutdown sends at most one request.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        
+        self.stop_state_polling()
+        if self._state['is_playing']:
+            self.stop_playback()
+        else:
+            self._stop_background_work()
+    
+    def install_signal_handlers(self):
+        """
+        Handle SIGINT and SIGTERM for a controller owned by the main thread
+        
+        This is opt-in, as only the host application knows whether it owns
+        signal handling. The handlers do no I/O: they signal the background
+        workers to stop and raise KeyboardInterrupt, so the host's normal
+        cleanup path calls close().
+        """
+        def handler(signum, frame):
+            self._stop_background.set()
+            raise KeyboardInterrupt
+        
+        signal.signal(signal.SIGINT, handler)
+        signal.signal(signal.SIGTERM, handler)
+    
+    @ttl_cache(DEVICES_CACHE_TTL)
+    def _fetch_devices(self) -> Dict:
+        """Fetch the raw device list, reused for DEVICES_CACHE_TTL seconds"""
+        return self.sp.devices()
+    
+    @ttl_cache(STATE_CACHE_TTL)
+    def _request_current_playback(self) -> Optional[Dict]:
+        """Fetch the raw playback state, reused for STATE_CACHE_TTL seconds"""
+        return self.sp.current_playback()
+    
+    def _fetch_current_playback(self) -> Optional[Dict]:
+        """Get the raw playback state, from the poller when it is running"""
+        snapshot = self._playback_snapshot
+        if self._polling and snapshot is not None:
+            return snapshot
+        return self._request_current_playback()
+    
+    def _invalidate_state(self):
+        """Drop cached device and playback state after a state-changing call"""
+        invalidate_ttl_cache(self, '_fetch_devices', '_request_current_playback')
+        # Have the poller pick up the change now rather than at its next tick
+        self._poll_wake.set()
+    
+    def start_state_polling(self, interval: float = STATE_POLL_INTERVAL) -> bool:
+        """
+        Poll the playback state in the background
+        
+        All readers of the playback state share the single polled copy, so
+        the number of API calls no longer grows with the number of callers.
+        
+        Args:
+            interval: Seconds between polls
             
-            for device in devices['devices']:
-                device_list.append({
+        Returns:
+            True if polling is running
+        """
+        self._poll_interval = interval
+        if self._polling and self._poll_thread and self._poll_thread.is_alive():
+            return True
+        
+        # A worker left over from a stop whose join timed out exits on its
+        # next check, as it is no longer the current poll thread
+        self._polling = True
+        self._poll_wake.clear()
+        self._poll_thread = threading.Thread(target=self._state_poll_worker, name="state-poll")
+        self._poll_thread.daemon = True
+        self._poll_thread.start()
+        
+        self.logger.info("Polling playback state every %ss", interval)
+        return True
+    
+    def set_polling_interval(self, interval: float):
+        """Change the polling interval, taking effect after the current wait"""
+        self._poll_interval = interval
+    
+    def stop_state_polling(self):
+        """Stop background polling, readers go back to on-demand requests"""
+        if not self._polling:
+            return
+        
+        self._polling = False
+        self._poll_wake.set()
+        if self._poll_thread and self._poll_thread is not threading.current_thread():
+            self._poll_thread.join(timeout=2)
+        self._playback_snapshot = None
+    
+    def _state_poll_worker(self):
+        """Background worker that refreshes the shared playback state"""
+        while self._polling and self._poll_thread is threading.current_thread():
+            # Cleared before the request, so a change made while it is in
+            # flight still triggers another poll straight away
+            self._poll_wake.clear()
+            try:
+                state = self.sp.current_playback()
+                self._playback_snapshot = state
+                
+                if state:
+                    changes = {'is_playing': state['is_playing']}
+                    volume = state['device']['volume_percent'] if state['device'] else None
+                    if volume is not None:
+                        changes['current_volume'] = volume
+                    self._update_state(**changes)
+                    
+            except Exception as e:
+                self.logger.warning("Error polling playback state: %s", e)
+            
+            self._poll_wake.wait(self._poll_interval)
+    
+    def invalidate_devices(self):
+        """Drop the cached device list so the next lookup fetches it again"""
+        invalidate_ttl_cache(self, '_fetch_devices')
+    
+    def get_available_devices(self, refresh: bool = False) -> List[Dict]:
+        """
+        Get list of available Spotify devices
+        
+        Args:
+            refresh: Bypass the short-lived device cache
+            
+        Returns:
+            List of device dictionaries
+        """
+        try:
+            if refresh:
+                self.invalidate_devices()
+            devices = self._fetch_devices()
+            device_list = [
+                {
                     'id': device['id'],
                     'name': device['name'],
                     'type': device['type'],
@@ -58,13 +254,15 @@ class PlaybackController:
                     'is_private_session': device['is_private_session'],
                     'is_restricted': device['is_restricted'],
                     'volume_percent': device['volume_percent']
-                })
+                }
+                for device in devices['devices']
+            ]
             
-            self.logger.info(f"Found {len(device_list)} available devices")
+            self.logger.info("Found %d available devices", len(device_list))
             return device_list
             
         except Exception as e:
-            self.logger.error(f"Error getting devices: {e}")
+            self.logger.error("Error getting devices: %s", e)
             return []
     
     def set_device(self, device_id: str = None, device_name: str = None) -> bool:
@@ -81,33 +279,44 @@ class PlaybackController:
         try:
             if device_id:
                 self.device_id = device_id
-                self.logger.info(f"Device set to ID: {device_id}")
+                self.logger.info("Device set to ID: %s", device_id)
                 return True
             elif device_name:
                 devices = self.get_available_devices()
                 for device in devices:
                     if device_name.lower() in device['name'].lower():
-                        self.device_id = device['id']
-                        self.logger.info(f"Device set to: {device['name']} (ID: {device['id']})")
+                        self._select_device(device)
+                        self.logger.info("Device set to: %s (ID: %s)", device['name'], device['id'])
                         return True
                 
-                self.logger.error(f"Device with name '{device_name}' not found")
+                # The device may have registered since the list was cached
+                self.invalidate_devices()
+                self.logger.error("Device with name '%s' not found", device_name)
                 return False
             else:
                 # Use first available device
                 devices = self.get_available_devices()
                 if devices:
-                    self.device_id = devices[0]['id']
-                    self.logger.info(f"Using first available device: {devices[0]['name']}")
+                    self._select_device(devices[0])
+                    self.logger.info("Using first available device: %s", devices[0]['name'])
                     return True
                 else:
                     self.logger.error("No devices available")
                     return False
                     
         except Exception as e:
-            self.logger.error(f"Error setting device: {e}")
+            self.invalidate_devices()
+            self.logger.error("Error setting device: %s", e)
             return False
     
+    def _select_device(self, device: Dict):
+        """Target a device, taking its volume from the device list just read"""
+        changes = {'device_id': device['id']}
+        # Devices that do not support volume control report None
+        if device['volume_percent'] is not None:
+            changes['current_volume'] = device['volume_percent']
+        self._update_state(**changes)
+    
     def start_playback(self, track_uris: List[str], device_id: str = None) -> bool:
         """
         Start playback of tracks
@@ -126,58 +335,106 @@ class PlaybackController:
                 self.logger.error("No device specified for playback")
                 return False
             
-            self.logger.info(f"Starting playback of {len(track_uris)} tracks on device: {target_device}")
+            self.logger.info("Starting playback of %d tracks on device: %s", len(track_uris), target_device)
             
             self.sp.start_playback(device_id=target_device, uris=track_uris)
-            self._is_playing = True
-            self._current_tracks = track_uris
+            self._invalidate_state()
+            self._current_tracks = list(track_uris)
+            self._update_state(is_playing=True, track_count=len(self._current_tracks))
+            
+            self.logger.info("Playback started successfully")
+            return True
+            
+        except Exception as e:
+            # The target device may have gone away
+            self.invalidate_devices()
+            self.logger.error("Error starting playback: %s", e)
+            return False
+    
+    def start_playlist(self, playlist_uri: str, device_id: str = None, track_count: int = 0) -> bool:
+        """
+        Start playback of a whole playlist
+        
+        The playlist is played as a context, so Spotify pages through it
+        itself and applies shuffle and repeat to every track, and playback
+        begins without loading any tracks first.
+        
+        Args:
+            playlist_uri: Spotify playlist URI
+            device_id: Optional device ID override
+            track_count: Number of tracks in the playlist, shown in the status
+            
+        Returns:
+            True if playback started successfully
+        """
+        try:
+            target_device = device_id or self.device_id
+            
+            if not target_device:
+                self.logger.error("No device specified for playback")
+                return False
+            
+            self.logger.info("Starting playlist %s on device: %s", playlist_uri, target_device)
+            
+            self.sp.start_playback(device_id=target_device, context_uri=playlist_uri)
+            self._invalidate_state()
+            self._current_tracks = []
+            self._update_state(is_playing=True, track_count=track_count)
             
             self.logger.info("Playback started successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error starting playback: {e}")
+            # The target device may have gone away
+            self.invalidate_devices()
+            self.logger.error("Error starting playlist: %s", e)
             return False
     
     def pause_playback(self) -> bool:
         """Pause current playback"""
         try:
             self.sp.pause_playback(device_id=self.device_id)
-            self._is_playing = False
+            self._invalidate_state()
+            self._update_state(is_playing=False)
             self.logger.info("Playback paused")
             return True
         except Exception as e:
-            self.logger.error(f"Error pausing playback: {e}")
+            self.logger.error("Error pausing playback: %s", e)
             return False
     
     def resume_playback(self) -> bool:
         """Resume paused playback"""
         try:
             self.sp.start_playback(device_id=self.device_id)
-            self._is_playing = True
+            self._invalidate_state()
+            self._update_state(is_playing=True)
             self.logger.info("Playback resumed")
             return True
         except Exception as e:
-            self.logger.error(f"Error resuming playback: {e}")
+            self.logger.error("Error resuming playback: %s", e)
             return False
     
+    def _stop_background_work(self):
+        """Stop any volume ramp"""
+        self._stop_background.set()
+        if self._background_thread and self._background_thread.is_alive():
+            self._background_thread.join(timeout=2)
+    
     def stop_playback(self) -> bool:
         """Stop current playback"""
         try:
-            # Stop background operations
-            self._stop_background.set()
-            if self._background_thread and self._background_thread.is_alive():
-                self._background_thread.join(timeout=2)
+            self._stop_background_work()
             
             # Pause playback
             self.sp.pause_playback(device_id=self.device_id)
-            self._is_playing = False
-            self._volume_ramp_active = False
+            self._invalidate_state()
+            self._update_state(is_playing=False, volume_ramp_active=False)
             
             self.logger.info("Playback stopped")
             return True
         except Exception as e:
-            self.logger.error(f"Error stopping playback: {e}")
+            self.invalidate_devices()
+            self.logger.error("Error stopping playback: %s", e)
             return False
     
     def set_volume(self, volume: int) -> bool:
@@ -192,77 +449,127 @@ class PlaybackController:
         """
         try:
             if not 0 <= volume <= 100:
-                self.logger.error(f"Invalid volume level: {volume}. Must be 0-100")
+                self.logger.error("Invalid volume level: %s. Must be 0-100", volume)
                 return False
             
             self.sp.volume(volume, device_id=self.device_id)
-            self._current_volume = volume
-            self.logger.info(f"Volume set to {volume}%")
+            self._invalidate_state()
+            self._update_state(current_volume=volume)
+            self.logger.info("Volume set to %s%%", volume)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error setting volume: {e}")
+            self.invalidate_devices()
+            self.logger.error("Error setting volume: %s", e)
             return False
     
+    def request_volume(self, volume: int):
+        """
+        Set the volume in the background, coalescing rapid requests
+        
+        Meant for callers such as a volume slider that change the level many
+        times a second. Only the latest level is sent, at most once per
+        VOLUME_DEBOUNCE_INTERVAL, by a single background thread so updates
+        cannot arrive out of order.
+        
+        Args:
+            volume: Volume level (0-100)
+        """
+        with self._volume_lock:
+            self._pending_volume = volume
+            if self._volume_sender_active:
+                return
+            self._volume_sender_active = True
+        
+        sender = threading.Thread(target=self._volume_sender, name="volume-sender")
+        sender.daemon = True
+        sender.start()
+    
+    def _volume_sender(self):
+        """Background task that sends the latest requested volume"""
+        while True:
+            time.sleep(VOLUME_DEBOUNCE_INTERVAL)
+            with self._volume_lock:
+                volume = self._pending_volume
+                self._pending_volume = None
+                if volume is None:
+                    self._volume_sender_active = False
+                    return
+            
+            self.set_volume(volume)
+    
     def get_current_volume(self) -> int:
         """Get current volume level"""
         try:
-            devices = self.sp.devices()
+            devices = self._fetch_devices()
             for device in devices['devices']:
                 if device['id'] == self.device_id:
                     volume = device['volume_percent']
-                    self._current_volume = volume
+                    self._update_state(current_volume=volume)
                     return volume
-            return self._current_volume
+            return self._state['current_volume']
         except Exception as e:
-            self.logger.error(f"Error getting volume: {e}")
-            return self._current_volume
+            self.logger.error("Error getting volume: %s", e)
+            return self._state['current_volume']
     
     def next_track(self) -> bool:
         """Skip to next track"""
         try:
             self.sp.next_track(device_id=self.device_id)
+            self._invalidate_state()
             self.logger.info("Skipped to next track")
             return True
         except Exception as e:
-            self.logger.error(f"Error skipping track: {e}")
+            self.logger.error("Error skipping track: %s", e)
             return False
     
     def previous_track(self) -> bool:
         """Go to previous track"""
         try:
             self.sp.previous_track(device_id=self.device_id)
+            self._invalidate_state()
             self.logger.info("Went to previous track")
             return True
         except Exception as e:
-            self.logger.error(f"Error going to previous track: {e}")
+            self.logger.error("Error going to previous track: %s", e)
             return False
     
     def get_playback_state(self) -> Optional[Dict]:
         """Get current playback state"""
         try:
-            state = self.sp.current_playback()
-            if state:
-                return {
-                    'is_playing': state['is_playing'],
-                    'progress_ms': state['progress_ms'],
-                    'track': {
-                        'name': state['item']['name'] if state['item'] else 'Unknown',
-                        'artist': ', '.join([artist['name'] for artist in state['item']['artists']]) if state['item'] else 'Unknown',
-                        'duration_ms': state['item']['duration_ms'] if state['item'] else 0
-                    },
-                    'device': {
-                        'name': state['device']['name'],
-                        'volume_percent': state['device']['volume_percent']
-                    }
+            state = self._fetch_current_playback()
+            if not state:
+                return None
+            
+            item = state['item']
+            device = state['device']
+            if item:
+                # str.join builds a list from any iterable, so passing a list
+                # directly is the cheaper form
+                track = {
+                    'name': item['name'],
+                    'artist': ', '.join([artist['name'] for artist in item['artists']]),
+                    'duration_ms': item['duration_ms']
                 }
-            return None
+            else:
+                track = {'name': 'Unknown', 'artist': 'Unknown', 'duration_ms': 0}
+            
+            return {
+                'is_playing': state['is_playing'],
+                'progress_ms': state['progress_ms'],
+                'track': track,
+                'device': {
+                    'name': device['name'],
+                    'volume_percent': device['volume_percent']
+                }
+            }
         except Exception as e:
-            self.logger.error(f"Error getting playback state: {e}")
+            self.logger.error("Error getting playback state: %s", e)
             return None
     
     def start_volume_ramp(self, start_volume: int = 10, end_volume: int = 80, 
-                         duration_seconds: int = 300, increment: int = 2) -> bool:
+                         duration_seconds: int = 300, increment: int = 2,
+                         min_api_interval: float = MIN_VOLUME_API_INTERVAL) -> bool:
         """
         Start gradual volume increase in background
         
@@ -271,30 +578,37 @@ class PlaybackController:
             end_volume: Target volume level
             duration_seconds: Total duration for the ramp
             increment: Volume increment per step
+            min_api_interval: Steps due sooner than this after the last volume
+                update are skipped, the final step is always sent
             
         Returns:
             True if ramp started successfully
         """
         try:
-            if self._volume_ramp_active:
+            if self._state['volume_ramp_active']:
                 self.logger.warning("Volume ramp already active")
                 return False
             
-            # Calculate delay between increments
-            total_increments = (end_volume - start_volume) // increment
+            # Plan every step up front. The last step may be partial, so the
+            # step count rounds up and the steps fill the whole duration.
+            total_increments = max(0, -(-(end_volume - start_volume) // increment))
             delay_per_increment = duration_seconds / total_increments if total_increments > 0 else 1
+            plan = [
+                min(start_volume + step * increment, end_volume)
+                for step in range(1, total_increments + 1)
+            ]
             
-            self.logger.info(f"Starting volume ramp: {start_volume}% -> {end_volume}% over {duration_seconds}s")
+            self.logger.info("Starting volume ramp: %s%% -> %s%% over %ss", start_volume, end_volume, duration_seconds)
             
             # Set initial volume
             self.set_volume(start_volume)
             
             # Start background ramp
-            self._volume_ramp_active = True
+            self._update_state(volume_ramp_active=True)
             self._stop_background.clear()
             self._background_thread = threading.Thread(
                 target=self._volume_ramp_worker,
-                args=(start_volume, end_volume, increment, delay_per_increment)
+                args=(start_volume, plan, delay_per_increment, min_api_interval)
             )
             self._background_thread.daemon = True
             self._background_thread.start()
@@ -302,48 +616,66 @@ class PlaybackController:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error starting volume ramp: {e}")
+            self.logger.error("Error starting volume ramp: %s", e)
             return False
     
-    def _volume_ramp_worker(self, start_volume: int, end_volume: int, 
-                           increment: int, delay: float):
+    def _volume_ramp_worker(self, start_volume: int, plan: List[int], delay: float,
+                           min_api_interval: float):
         """Background worker for volume ramping"""
         try:
             current_volume = start_volume
             
-            while (current_volume < end_volume and 
-                   not self._stop_background.is_set() and 
-                   self._volume_ramp_active):
-                
-                time.sleep(delay)
-                
-                if self._stop_background.is_set():
+            # Every step is scheduled against an absolute deadline, so time
+            # spent in set_volume does not push later steps back. Waiting on
+            # the stop event lets a stop interrupt the wait straight away.
+            # Bound once, these are used on every step
+            monotonic = time.monotonic
+            wait_for_stop = self._stop_background.wait
+            set_volume = self.set_volume
+            last_step = len(plan)
+            
+            start = monotonic()
+            last_sent = start
+            
+            for step, volume in enumerate(plan, 1):
+                deadline = start + delay * step
+                if wait_for_stop(max(0.0, deadline - monotonic())):
+                    break
+                # Read from the live snapshot, stop_volume_ramp may clear it
+                if not self._state['volume_ramp_active']:
                     break
                 
-                current_volume = min(current_volume + increment, end_volume)
-                self.set_volume(current_volume)
+                # Coalesce fast ramps into fewer API calls, the volume catches
+                # up at the next step that is sent
+                now = monotonic()
+                if step < last_step and now - last_sent < min_api_interval:
+                    continue
+                last_sent = now
                 
-                self.logger.debug(f"Volume ramp: {current_volume}%")
+                current_volume = volume
+                # set_volume already logs each level
+                set_volume(current_volume)
             
-            self._volume_ramp_active = False
-            self.logger.info(f"Volume ramp completed at {current_volume}%")
+            self._update_state(volume_ramp_active=False)
+            self.logger.info("Volume ramp completed at %s%%", current_volume)
             
         except Exception as e:
-            self.logger.error(f"Error in volume ramp worker: {e}")
-            self._volume_ramp_active = False
+            self.logger.error("Error in volume ramp worker: %s", e)
+            self._update_state(volume_ramp_active=False)
     
     def stop_volume_ramp(self) -> bool:
         """Stop active volume ramp"""
         try:
-            if self._volume_ramp_active:
-                self._volume_ramp_active = False
+            if self._state['volume_ramp_active']:
+                self._update_state(volume_ramp_active=False)
+                self._stop_background.set()
                 self.logger.info("Volume ramp stopped")
                 return True
             else:
                 self.logger.info("No active volume ramp to stop")
                 return False
         except Exception as e:
-            self.logger.error(f"Error stopping volume ramp: {e}")
+            self.logger.error("Error stopping volume ramp: %s", e)
             return False
     
     def play_playlist_with_ramp(self, track_uris: List[str], playlist_name: str = None,
@@ -364,7 +696,7 @@ class PlaybackController:
         """
         try:
             playlist_name = playlist_name or "Unknown Playlist"
-            self.logger.info(f"Starting playlist '{playlist_name}' with volume ramp")
+            self.logger.info("Starting playlist '%s' with volume ramp", playlist_name)
             
             # Start playback
             if not self.start_playback(track_uris):
@@ -374,28 +706,26 @@ class PlaybackController:
             if not self.start_volume_ramp(start_volume, end_volume, ramp_duration):
                 self.logger.warning("Failed to start volume ramp, continuing with playback")
             
-            self._current_playlist = playlist_name
+            self._update_state(current_playlist=playlist_name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error playing playlist with ramp: {e}")
+            self.logger.error("Error playing playlist with ramp: %s", e)
             return False
     
     def is_playing(self) -> bool:
         """Check if currently playing"""
-        return self._is_playing
+        return self._state['is_playing']
     
     def is_volume_ramping(self) -> bool:
         """Check if volume ramp is active"""
-        return self._volume_ramp_active
+        return self._state['volume_ramp_active']
     
     def get_status(self) -> Dict:
-        """Get comprehensive status information"""
-        return {
-            'is_playing': self._is_playing,
-            'current_volume': self._current_volume,
-            'volume_ramp_active': self._volume_ramp_active,
-            'current_playlist': self._current_playlist,
-            'device_id': self.device_id,
-            'track_count': len(self._current_tracks)
-        }
+        """
+        Get comprehensive status information
+        
+        Returns:
+            Copy of the current status snapshot, callers may change it freely
+        """
+        return dict(self._state)
@@ -3,17 +3,54 @@ Playlist Manager Module
 Handles playlist search, retrieval, and management
 """
 
-import spotipy
-from typing import Dict, List, Optional, Tuple
+import itertools
+import re
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 from logger import get_logger
 
+from .cache import PlaylistCache, DEFAULT_CACHE_PATH
+from .executor import get_executor
+from .session import ensure_pooled_session
+
+if TYPE_CHECKING:
+    # Only needed for annotations, the client is passed in by the caller
+    import spotipy
+
+
+# Spotify caps playlist track pages at 100 items
+TRACKS_PAGE_SIZE = 100
+
+# Largest page of the user's playlists Spotify returns
+USER_PLAYLISTS_PAGE_SIZE = 50
+
+# Response projections, only the fields we read are requested from Spotify
+TRACKS_PAGE_FIELDS = 'items(track(uri)),next,total'
+PLAYLIST_INFO_FIELDS = (
+    'id,name,description,owner(id,display_name),tracks(total),followers(total),'
+    'public,collaborative,uri,external_urls,images'
+)
+
+# Playlist references that can be resolved without a search
+PLAYLIST_URI_PREFIX = 'spotify:playlist:'
+PLAYLIST_ID_PATTERN = re.compile(r'[A-Za-z0-9]{22}')
+
+# URIs that can be started and queued through the Web API; local files and
+# malformed entries in a playlist would make start_playback fail
+PLAYABLE_URI_PATTERN = re.compile(r'spotify:(?:track|episode):[A-Za-z0-9]{22}')
+
 
 class PlaylistManager:
     """Manages playlist operations and search functionality"""
     
-    def __init__(self, spotify_client: spotipy.Spotify):
+    def __init__(self, spotify_client: 'spotipy.Spotify', cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         self.sp = spotify_client
         self.logger = get_logger("playlist_manager")
+        ensure_pooled_session(self.sp)
+        
+        # On-disk cache for track lists and searches, disabled when cache_path is None
+        self.cache = PlaylistCache(cache_path) if cache_path else None
+        # Current user's ID, fetched on first cache use to key cached entries
+        self._user_id = None
         self.logger.info("PlaylistManager initialized")
     
     def search_playlists(self, query: str, limit: int = 10) -> List[Dict]:
@@ -28,74 +65,141 @@ class PlaylistManager:
             List of playlist dictionaries with id, name, owner, and track count
         """
         try:
-            self.logger.info(f"Searching for playlists with query: '{query}'")
+            user_id = self._get_cache_user_id()
+            if user_id:
+                cached = self.cache.get_search(user_id, query, limit)
+                if cached is not None:
+                    self.logger.info("Using cached search results for query: '%s'", query)
+                    return cached
+            
+            self.logger.info("Searching for playlists with query: '%s'", query)
+            
+            # Both searches run at once, public playlists on a worker thread.
+            # The public search asks for the full limit since the number of
+            # user matches is not known yet; the combined list is cut to size.
+            public_future = get_executor().submit(self._search_public_playlists, query, limit)
             
             # Search user's own playlists first
             user_playlists = self._search_user_playlists(query, limit // 2)
+            public_playlists = public_future.result()
             
-            # Search public playlists
-            public_playlists = self._search_public_playlists(query, limit - len(user_playlists))
+            # Combine and deduplicate in one dict, which keeps insertion order.
+            # setdefault keeps the first occurrence, so a user's own playlist is
+            # not replaced by the same playlist from the public results.
+            unique_by_id = {}
+            for playlist in (user_playlists or []) + (public_playlists or []):
+                unique_by_id.setdefault(playlist['id'], playlist)
+            unique_playlists = list(unique_by_id.values())
             
-            # Combine and deduplicate
-            all_playlists = user_playlists + public_playlists
-            seen_ids = set()
-            unique_playlists = []
+            self.logger.info("Found %d unique playlists", len(unique_playlists))
+            unique_playlists = unique_playlists[:limit]
             
-            for playlist in all_playlists:
-                if playlist['id'] not in seen_ids:
-                    seen_ids.add(playlist['id'])
-                    unique_playlists.append(playlist)
+            # A failed search leaves the results empty or partial, caching
+            # them would hide the playlists until SEARCH_TTL runs out
+            if user_id and user_playlists is not None and public_playlists is not None:
+                self.cache.put_search(user_id, query, limit, unique_playlists)
             
-            self.logger.info(f"Found {len(unique_playlists)} unique playlists")
-            return unique_playlists[:limit]
+            return unique_playlists
             
         except Exception as e:
-            self.logger.error(f"Error searching playlists: {e}")
+            self.logger.error("Error searching playlists: %s", e)
             return []
     
-    def _search_user_playlists(self, query: str, limit: int) -> List[Dict]:
-        """Search user's own playlists"""
+    def _search_user_playlists(self, query: str, limit: int) -> Optional[List[Dict]]:
+        """Search user's own playlists, None if the search failed"""
         try:
-            user_playlists = []
-            offset = 0
-            query_lower = query.lower()
+            # casefold() also matches names that differ beyond simple case,
+            # e.g. 'ß' and 'ss'
+            query_folded = query.casefold()
             
-            while len(user_playlists) < limit:
-                results = self.sp.current_user_playlists(limit=50, offset=offset)
-                
-                if not results['items']:
-                    break
-                
-                for playlist in results['items']:
-                    if playlist and playlist['name']:
-                        if query_lower in playlist['name'].lower():
-                            user_playlists.append({
-                                'id': playlist['id'],
-                                'name': playlist['name'],
-                                'owner': playlist['owner']['display_name'] or playlist['owner']['id'],
-                                'track_count': playlist['tracks']['total'],
-                                'is_own': True,
-                                'public': playlist['public'],
-                                'description': playlist.get('description', ''),
-                                'uri': playlist['uri']
-                            })
-                            
-                            if len(user_playlists) >= limit:
-                                break
-                
-                offset += 50
-                if offset >= results['total']:
-                    break
+            # Each page's names are folded in one comprehension, pages are only
+            # fetched until enough matches have been found
+            named_pages = (
+                [playlist for playlist in page if playlist['name']]
+                for page in self._iter_user_playlist_pages()
+            )
+            matches = (
+                playlist
+                for page in named_pages
+                for playlist, name_folded in zip(page, [item['name'].casefold() for item in page])
+                if query_folded in name_folded
+            )
+            
+            user_playlists = [
+                {
+                    'id': playlist['id'],
+                    'name': playlist['name'],
+                    'owner': playlist['owner']['display_name'] or playlist['owner']['id'],
+                    'track_count': playlist['tracks']['total'],
+                    'is_own': True,
+                    'public': playlist['public'],
+                    'description': playlist.get('description', ''),
+                    'uri': playlist['uri']
+                }
+                for playlist in itertools.islice(matches, limit)
+            ]
             
-            self.logger.debug(f"Found {len(user_playlists)} user playlists matching '{query}'")
+            self.logger.debug("Found %d user playlists matching '%s'", len(user_playlists), query)
             return user_playlists
             
         except Exception as e:
-            self.logger.error(f"Error searching user playlists: {e}")
-            return []
+            self.logger.error("Error searching user playlists: %s", e)
+            return None
+    
+    def _get_cache_user_id(self) -> Optional[str]:
+        """
+        Get the current user's ID for keying cached entries
+        
+        Several accounts can share one cache file, so entries holding a
+        user's own playlists are stored under that user's ID.
+        
+        Returns:
+            User ID, or None if caching is disabled or the ID is unavailable
+        """
+        if not self.cache:
+            return None
+        
+        if self._user_id is None:
+            try:
+                self._user_id = self.sp.me()['id']
+            except Exception as e:
+                self.logger.warning("Could not get user ID, skipping cache: %s", e)
+                return None
+        
+        return self._user_id
     
-    def _search_public_playlists(self, query: str, limit: int) -> List[Dict]:
-        """Search public playlists"""
+    def _iter_user_playlist_pages(self, limit: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Yield the current user's playlists a page at a time
+        
+        Pages are requested lazily and the walk stops at the last page.
+        
+        Args:
+            limit: Total number of playlists wanted, the final request is sized
+                to fetch no more than that. None walks every page.
+            
+        Yields:
+            Lists of playlist objects, empty entries removed
+        """
+        offset = 0
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = USER_PLAYLISTS_PAGE_SIZE
+            if remaining is not None:
+                page_size = min(page_size, remaining)
+            
+            results = self.sp.current_user_playlists(limit=page_size, offset=offset)
+            page = [playlist for playlist in results['items'] if playlist]
+            yield page
+            
+            if not results['next']:
+                return
+            offset += page_size
+            if remaining is not None:
+                remaining -= len(page)
+    
+    def _search_public_playlists(self, query: str, limit: int) -> Optional[List[Dict]]:
+        """Search public playlists, None if the search failed"""
         try:
             results = self.sp.search(q=query, type='playlist', limit=limit)
             public_playlists = []
@@ -113,92 +217,205 @@ class PlaylistManager:
                         'uri': playlist['uri']
                     })
             
-            self.logger.debug(f"Found {len(public_playlists)} public playlists matching '{query}'")
+            self.logger.debug("Found %d public playlists matching '%s'", len(public_playlists), query)
             return public_playlists
             
         except Exception as e:
-            self.logger.error(f"Error searching public playlists: {e}")
-            return []
+            self.logger.error("Error searching public playlists: %s", e)
+            return None
     
     def get_playlist_by_name(self, name: str, exact_match: bool = False) -> Optional[Dict]:
         """
         Get a specific playlist by name
         
+        A playlist URI or 22-character playlist ID is looked up directly
+        through get_playlist_info() instead of searching.
+        
         Args:
-            name: Playlist name to search for
+            name: Playlist name, URI or ID to search for
             exact_match: If True, requires exact name match
             
         Returns:
             Playlist dictionary or None if not found
         """
         try:
+            playlist_id = self._parse_playlist_id(name)
+            if playlist_id:
+                playlist = self.get_playlist_info(playlist_id)
+                if playlist:
+                    self.logger.info("Found playlist by ID: '%s'", playlist['name'])
+                    return playlist
+                # A name that merely looks like an ID, search for it instead
+            
             playlists = self.search_playlists(name, limit=50)
             
             if exact_match:
                 # Look for exact match first
                 for playlist in playlists:
                     if playlist['name'].lower() == name.lower():
-                        self.logger.info(f"Found exact match for playlist: '{name}'")
+                        self.logger.info("Found exact match for playlist: '%s'", name)
                         return playlist
                 return None
             else:
                 # Return first match (best match from search)
                 if playlists:
-                    self.logger.info(f"Found playlist match: '{playlists[0]['name']}'")
+                    self.logger.info("Found playlist match: '%s'", playlists[0]['name'])
                     return playlists[0]
                 return None
                 
         except Exception as e:
-            self.logger.error(f"Error getting playlist by name '{name}': {e}")
+            self.logger.error("Error getting playlist by name '%s': %s", name, e)
             return None
     
-    def get_playlist_tracks(self, playlist_id: str) -> List[str]:
+    @staticmethod
+    def _parse_playlist_id(name: str) -> Optional[str]:
+        """Return the playlist ID if name is a playlist URI or bare ID"""
+        if name.startswith(PLAYLIST_URI_PREFIX):
+            return name[len(PLAYLIST_URI_PREFIX):] or None
+        if PLAYLIST_ID_PATTERN.fullmatch(name):
+            return name
+        return None
+    
+    def get_playlist_tracks(self, playlist_id: str, refresh: bool = False) -> List[str]:
         """
         Get all track URIs from a playlist
         
+        Track lists are served from the on-disk cache while the playlist's
+        snapshot ID is unchanged. Otherwise the first page is fetched to learn
+        the playlist's total size, then the remaining pages are requested
+        concurrently.
+        
         Args:
             playlist_id: Spotify playlist ID
+            refresh: Ignore the cached track list and fetch it again
             
         Returns:
             List of track URIs
         """
         try:
-            self.logger.info(f"Fetching tracks for playlist ID: {playlist_id}")
+            snapshot_id = None
+            if self.cache:
+                snapshot_id = self._get_snapshot_id(playlist_id)
+                cached = None if refresh else self.cache.get_tracks(playlist_id, snapshot_id)
+                if cached is not None:
+                    self.logger.info("Using %d cached tracks for playlist ID: %s", len(cached), playlist_id)
+                    return cached
             
-            tracks = []
-            offset = 0
+            self.logger.info("Fetching tracks for playlist ID: %s", playlist_id)
             
-            while True:
-                results = self.sp.playlist_tracks(playlist_id, offset=offset, limit=100)
-                
-                for item in results['items']:
-                    if item['track'] and item['track']['uri']:
-                        tracks.append(item['track']['uri'])
-                
-                if not results['next']:
-                    break
-                    
-                offset += 100
+            first_page = self._fetch_tracks_page(playlist_id, 0)
+            pages = [first_page]
+            
+            offsets = range(TRACKS_PAGE_SIZE, first_page['total'], TRACKS_PAGE_SIZE)
+            if offsets:
+                # map() yields results in offset order, keeping the track order stable
+                pages.extend(get_executor().map(
+                    lambda offset: self._fetch_tracks_page(playlist_id, offset),
+                    offsets
+                ))
+            
+            tracks = [uri for page in pages for uri in self._extract_track_uris(page)]
+            
+            self.logger.info("Retrieved %d tracks from playlist", len(tracks))
+            
+            if self.cache:
+                self.cache.put_tracks(playlist_id, snapshot_id, tracks)
             
-            self.logger.info(f"Retrieved {len(tracks)} tracks from playlist")
             return tracks
             
         except Exception as e:
-            self.logger.error(f"Error fetching playlist tracks: {e}")
+            self.logger.error("Error fetching playlist tracks: %s", e)
             return []
     
-    def get_playlist_info(self, playlist_id: str) -> Optional[Dict]:
+    def iter_playlist_track_pages(self, playlist_id: str, refresh: bool = False) -> Iterator[List[str]]:
+        """
+        Yield a playlist's track URIs one page at a time
+        
+        Pages are walked through their 'next' links, and the following page is
+        requested in the background while the caller handles the current one.
+        This lets callers start working before the whole playlist is loaded.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            refresh: Ignore the cached track list and fetch it again
+            
+        Yields:
+            Lists of up to TRACKS_PAGE_SIZE track URIs, in playlist order
+        """
+        try:
+            snapshot_id = None
+            if self.cache:
+                snapshot_id = self._get_snapshot_id(playlist_id)
+                cached = None if refresh else self.cache.get_tracks(playlist_id, snapshot_id)
+                if cached is not None:
+                    self.logger.info("Streaming %d cached tracks for playlist ID: %s", len(cached), playlist_id)
+                    for start in range(0, len(cached), TRACKS_PAGE_SIZE):
+                        yield cached[start:start + TRACKS_PAGE_SIZE]
+                    return
+            
+            self.logger.info("Streaming tracks for playlist ID: %s", playlist_id)
+            
+            tracks = []
+            page = self._fetch_tracks_page(playlist_id, 0)
+            while page:
+                # Prefetch the next page before handing this one to the caller.
+                # The fetch is a short task on the shared pool, so callers must
+                # not consume this generator from a task on that pool.
+                next_page = get_executor().submit(self.sp.next, page) if page['next'] else None
+                
+                uris = self._extract_track_uris(page)
+                tracks.extend(uris)
+                yield uris
+                
+                page = next_page.result() if next_page else None
+            
+            self.logger.info("Streamed %d tracks from playlist", len(tracks))
+            
+            if self.cache:
+                self.cache.put_tracks(playlist_id, snapshot_id, tracks)
+                
+        except Exception as e:
+            self.logger.error("Error streaming playlist tracks: %s", e)
+    
+    def _get_snapshot_id(self, playlist_id: str) -> str:
+        """Get the current snapshot ID of a playlist"""
+        return self.sp.playlist(playlist_id, fields='snapshot_id')['snapshot_id']
+    
+    @staticmethod
+    def _extract_track_uris(page: Dict) -> List[str]:
+        """Get the playable track URIs from a page of playlist items"""
+        # Chained generators look up each item's track and URI only once
+        tracks = (item['track'] for item in page['items'])
+        uris = (track['uri'] for track in tracks if track)
+        is_playable = PLAYABLE_URI_PATTERN.fullmatch
+        return [uri for uri in uris if uri and is_playable(uri)]
+    
+    def _fetch_tracks_page(self, playlist_id: str, offset: int) -> Dict:
+        """Fetch a single page of playlist tracks"""
+        return self.sp.playlist_tracks(
+            playlist_id, fields=TRACKS_PAGE_FIELDS, offset=offset, limit=TRACKS_PAGE_SIZE
+        )
+    
+    def get_playlist_info(self, playlist_id: str, refresh: bool = False) -> Optional[Dict]:
         """
         Get detailed playlist information
         
         Args:
             playlist_id: Spotify playlist ID
+            refresh: Ignore cached details and fetch them again
             
         Returns:
             Detailed playlist information dictionary
         """
         try:
-            playlist = self.sp.playlist(playlist_id)
+            cache_key = f"info:{playlist_id}"
+            if self.cache and not refresh:
+                cached = self.cache.get_entry(cache_key)
+                if cached is not None:
+                    self.logger.debug("Using cached info for playlist: '%s'", cached['name'])
+                    return cached
+            
+            playlist = self.sp.playlist(playlist_id, fields=PLAYLIST_INFO_FIELDS)
             
             info = {
                 'id': playlist['id'],
@@ -214,62 +431,92 @@ class PlaylistManager:
                 'images': playlist['images']
             }
             
-            self.logger.debug(f"Retrieved info for playlist: '{info['name']}'")
+            self.logger.debug("Retrieved info for playlist: '%s'", info['name'])
+            
+            if self.cache:
+                self.cache.put_entry(cache_key, info)
+            
             return info
             
         except Exception as e:
-            self.logger.error(f"Error getting playlist info: {e}")
+            self.logger.error("Error getting playlist info: %s", e)
             return None
     
-    def list_user_playlists(self, limit: int = 50) -> List[Dict]:
+    def list_user_playlists(self, limit: int = 50, refresh: bool = False) -> List[Dict]:
         """
         List all user's playlists
         
         Args:
             limit: Maximum number of playlists to return
+            refresh: Ignore the cached list and fetch it again
             
         Returns:
             List of user's playlists
         """
         try:
+            user_id = self._get_cache_user_id()
+            cache_key = f"user_playlists:{user_id}:{limit}"
+            if user_id and not refresh:
+                cached = self.cache.get_entry(cache_key)
+                if cached is not None:
+                    self.logger.info("Using %d cached user playlists", len(cached))
+                    return cached
+            
             self.logger.info("Fetching user's playlists")
             
-            playlists = []
-            offset = 0
+            playlists = [
+                {
+                    'id': playlist['id'],
+                    'name': playlist['name'],
+                    'owner': playlist['owner']['display_name'] or playlist['owner']['id'],
+                    'track_count': playlist['tracks']['total'],
+                    'public': playlist['public'],
+                    'collaborative': playlist['collaborative'],
+                    'description': playlist.get('description', ''),
+                    'uri': playlist['uri']
+                }
+                for page in self._iter_user_playlist_pages(limit)
+                for playlist in page
+            ]
             
-            while len(playlists) < limit:
-                results = self.sp.current_user_playlists(limit=50, offset=offset)
-                
-                if not results['items']:
-                    break
-                
-                for playlist in results['items']:
-                    if playlist:
-                        playlists.append({
-                            'id': playlist['id'],
-                            'name': playlist['name'],
-                            'owner': playlist['owner']['display_name'] or playlist['owner']['id'],
-                            'track_count': playlist['tracks']['total'],
-                            'public': playlist['public'],
-                            'collaborative': playlist['collaborative'],
-                            'description': playlist.get('description', ''),
-                            'uri': playlist['uri']
-                        })
-                        
-                        if len(playlists) >= limit:
-                            break
-                
-                offset += 50
-                if offset >= results['total']:
-                    break
+            self.logger.info("Retrieved %d user playlists", len(playlists))
+            
+            if user_id:
+                self.cache.put_entry(cache_key, playlists)
             
-            self.logger.info(f"Retrieved {len(playlists)} user playlists")
             return playlists
             
         except Exception as e:
-            self.logger.error(f"Error listing user playlists: {e}")
+            self.logger.error("Error listing user playlists: %s", e)
             return []
     
+    def invalidate(self, playlist_id: str):
+        """
+        Drop cached data for a playlist, e.g. after modifying it
+        
+        Args:
+            playlist_id: Spotify playlist ID
+        """
+        if self.cache:
+            self.cache.invalidate_playlist(playlist_id)
+            self.logger.debug("Invalidated cache for playlist ID: %s", playlist_id)
+    
+    @staticmethod
+    def merge_uris(*uri_lists: List[str]) -> List[str]:
+        """
+        Merge track URI lists, dropping repeats
+        
+        Use this when combining tracks from several playlists rather than
+        checking each URI against the list built so far, which is quadratic.
+        
+        Args:
+            uri_lists: Track URI lists to merge
+            
+        Returns:
+            URIs in first-seen order, each listed once
+        """
+        return list(dict.fromkeys(itertools.chain.from_iterable(uri_lists)))
+    
     def create_playlist_summary(self, playlist: Dict) -> str:
         """
         Create a human-readable summary of a playlist
@@ -0,0 +1,114 @@
+"""
+HTTP Session Module
+Builds the pooled requests session shared by all Spotify API calls
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional, decodes large playlist pages several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Connection pool sizing, large enough for concurrent playlist page fetches
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Status codes that are retried, honouring Retry-After on 429
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Methods that are safe to send again after a server error. Other methods,
+# such as POST /me/player/queue, are only retried on 429.
+IDEMPOTENT_METHODS = frozenset(['GET', 'PUT', 'DELETE'])
+
+# Random extra backoff in seconds, so concurrent page fetches that were
+# throttled together do not all retry at the same moment
+RETRY_BACKOFF_JITTER = 0.5
+
+# (connect, read) timeouts in seconds for Spotify API and token requests.
+# A short connect timeout fails fast on a dead network, the longer read
+# timeout leaves room for large playlist pages on slow devices.
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+class _SpotifyRetry(Retry):
+    """Retry that repeats non-idempotent requests only when throttled"""
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        # A POST answered with 5xx may already have been applied, sending it
+        # again could e.g. add the same track to the queue twice
+        if method.upper() not in IDEMPOTENT_METHODS and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _OrjsonAdapter(HTTPAdapter):
+    """HTTPAdapter whose responses decode JSON bodies with orjson"""
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+
+        def decode_json(**kwargs):
+            # orjson takes no decoder options, fall back for callers that pass any
+            if kwargs:
+                return requests.Response.json(response, **kwargs)
+            return orjson.loads(response.content)
+
+        response.json = decode_json
+        return response
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries
+
+    Reusing one session keeps TCP and TLS connections to the Spotify API
+    alive between calls, including calls made from worker threads.
+
+    Returns:
+        Configured requests session
+    """
+    retry_options = dict(
+        total=5,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        respect_retry_after_header=True
+    )
+    try:
+        retry = _SpotifyRetry(backoff_jitter=RETRY_BACKOFF_JITTER, **retry_options)
+    except TypeError:
+        # backoff_jitter needs urllib3 2.0 or newer
+        retry = _SpotifyRetry(**retry_options)
+    adapter_class = _OrjsonAdapter if orjson is not None else HTTPAdapter
+    adapter = adapter_class(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def ensure_pooled_session(spotify_client) -> None:
+    """
+    Give a spotipy client a pooled session if it has none
+
+    A client created with requests_session=False sends every call through
+    the requests.api module, opening a new connection each time. Such
+    clients are switched to a session from create_session(); clients that
+    already have a session are left alone.
+
+    Args:
+        spotify_client: spotipy.Spotify instance
+    """
+    if not isinstance(getattr(spotify_client, '_session', None), requests.Session):
+        spotify_client._session = create_session()